@@ -473,19 +473,14 @@ async def run_agent(
                 check_cancelled()
             func_name = tc["function"]["name"]
             raw_args = tc["function"].get("arguments") or ""
-            try:
-                parsed_args = json.loads(raw_args) if raw_args else {}
-            except json.JSONDecodeError:
-                parsed_args = None
+            parsed_args = _parse_tool_args(raw_args)
+            if parsed_args is None:
                 logger.warning(
-                    "%s malformed JSON in tool args for %s: %s",
+                    "%s malformed or non-object tool args for %s: %s",
                     step,
                     func_name,
                     raw_args[:200],
                 )
-            if parsed_args is not None and not isinstance(parsed_args, dict):
-                parsed_args = None
-                logger.warning("%s non-object tool args for %s", step, func_name)
             args = parsed_args or {}
 
             # Signal tool execution
@@ -536,6 +531,21 @@ async def run_agent(
     return "[max iterations reached]"
 
 
+def _parse_tool_args(raw_args: str) -> dict[str, Any] | None:
+    """Decode tool-call arguments, returning None unless they are a JSON object."""
+    if not raw_args:
+        return {}
+    # Anything that does not open with "{" cannot decode to an object, so
+    # reject it up front instead of paying for a JSONDecodeError unwind.
+    if raw_args.lstrip()[:1] != "{":
+        return None
+    try:
+        parsed = json.loads(raw_args)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
 def _extract_text_content(content: Any) -> str:
     if isinstance(content, str):
         return content
@@ -6,13 +6,12 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
-from operator_ai.config import OPERATOR_DIR
+from operator_ai.config import AGENTS_DIR
 from operator_ai.skills import extract_body, parse_frontmatter
+from operator_ai.utils import subdir_names
 
 logger = logging.getLogger("operator.agents")
 
-AGENTS_DIR = OPERATOR_DIR / "agents"
-
 
 @dataclass
 class AgentInfo:
@@ -23,20 +22,20 @@ class AgentInfo:
 def scan_agents(agents_dir: Path = AGENTS_DIR) -> list[AgentInfo]:
     """Scan agents/*/AGENT.md for frontmatter with name and description."""
     agents: list[AgentInfo] = []
-    if not agents_dir.is_dir():
-        return agents
-
-    for agent_dir in sorted(agents_dir.iterdir()):
-        if not agent_dir.is_dir():
+    for dir_name in subdir_names(agents_dir):
+        agent_md = agents_dir / dir_name / "AGENT.md"
+        try:
+            text = agent_md.read_text()
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        agent_md = agent_dir / "AGENT.md"
-        if not agent_md.exists():
+        except Exception as e:
+            logger.warning("Failed to parse %s: %s", agent_md, e)
             continue
         try:
-            fm = parse_frontmatter(agent_md.read_text())
+            fm = parse_frontmatter(text)
             if not fm:
                 continue
-            name = fm.get("name", agent_dir.name)
+            name = fm.get("name", dir_name)
             description = fm.get("description", "")
             if not description:
                 continue
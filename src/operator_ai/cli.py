@@ -14,6 +14,7 @@ import sys
 import textwrap
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -28,14 +29,10 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
-import operator_ai.tools  # noqa: F401
 from operator_ai.agents import scan_agents
 from operator_ai.config import OPERATOR_DIR, ConfigError, load_config
 from operator_ai.job_specs import find_job_spec, scan_job_specs
-from operator_ai.jobs import run_job_now
-from operator_ai.log_context import RunContextFilter
-from operator_ai.main import async_main
-from operator_ai.memory import MemoryStore
+from operator_ai.log_context import RunContextFilter, quiet_noisy_loggers
 from operator_ai.prompts import load_prompt
 from operator_ai.skills import (
     install_bundled_skills,
@@ -45,8 +42,6 @@ from operator_ai.skills import (
     scan_skills,
 )
 from operator_ai.store import get_store
-from operator_ai.tools.registry import get_tools
-from operator_ai.transport.cli import CliTransport
 
 console = Console()
 logger = logging.getLogger("operator.cli")
@@ -70,10 +65,11 @@ LOG_FILE = LOG_DIR / "operator.log"
 
 # ── Service constants ────────────────────────────────────────
 
+_HOME = Path.home()
 _LAUNCHD_LABEL = "ai.operator"
-_PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / f"{_LAUNCHD_LABEL}.plist"
+_PLIST_PATH = _HOME / "Library" / "LaunchAgents" / f"{_LAUNCHD_LABEL}.plist"
 _SYSTEMD_UNIT = "operator.service"
-_SYSTEMD_DIR = Path.home() / ".config" / "systemd" / "user"
+_SYSTEMD_DIR = _HOME / ".config" / "systemd" / "user"
 _SYSTEMD_PATH = _SYSTEMD_DIR / _SYSTEMD_UNIT
 
 
@@ -100,8 +96,7 @@ def _setup_cli_logging() -> None:
     root.addHandler(fh)
     root.addHandler(sh)
 
-    for name in ("httpx", "httpcore", "litellm", "openai"):
-        logging.getLogger(name).setLevel(logging.WARNING)
+    quiet_noisy_loggers()
 
 
 def _resolve_agent(agent: str | None) -> str:
@@ -316,8 +311,8 @@ def _scaffold_operator_home(
     ]
     for d in dirs:
         d.mkdir(parents=True, exist_ok=True)
-        if emit_output:
-            console.print(f"  [dim]created[/dim] {d}/")
+    if emit_output:
+        console.print("\n".join(f"  [dim]created[/dim] {d}/" for d in dirs))
 
     env_file = home / ".env"
     wrote_env_file = False
@@ -360,9 +355,8 @@ def _scaffold_operator_home(
                 console.print(f"  [green]wrote[/green]  {path}")
 
     installed = install_bundled_skills(home / "skills")
-    if emit_output:
-        for skill_name in installed:
-            console.print(f"  [green]skill[/green]  {skill_name}")
+    if emit_output and installed:
+        console.print("\n".join(f"  [green]skill[/green]  {n}" for n in installed))
 
     return ScaffoldResult(
         home=home,
@@ -400,7 +394,8 @@ def _quote_env_value(value: str) -> str:
 
 def _update_env_file(path: Path, updates: dict[str, str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    lines = path.read_text().splitlines() if path.exists() else []
+    original = path.read_text() if path.exists() else None
+    lines = original.splitlines() if original is not None else []
     pending = dict(updates)
     new_lines: list[str] = []
 
@@ -421,8 +416,18 @@ def _update_env_file(path: Path, updates: dict[str, str]) -> None:
     for env_var, value in pending.items():
         new_lines.append(f"{env_var}={_quote_env_value(value)}")
 
-    path.write_text("\n".join(new_lines).rstrip() + "\n")
-    path.chmod(0o600)
+    content = "\n".join(new_lines).rstrip() + "\n"
+    if content == original:
+        path.chmod(0o600)
+        return
+    # Write a private sibling and rename over the original so a crash
+    # mid-write never leaves a truncated .env with secrets half-written.
+    tmp = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+    tmp.chmod(0o600)
+    tmp.replace(path)
 
 
 def _default_setup_username() -> str:
@@ -454,6 +459,12 @@ def _timezone_from_zoneinfo_path(path: Path) -> str | None:
     return _normalize_timezone_name(candidate)
 
 
+@lru_cache(maxsize=32)
+def _which(name: str) -> str | None:
+    """``shutil.which`` memoized for the life of the process (PATH doesn't change)."""
+    return shutil.which(name)
+
+
 def _detect_local_timezone() -> str:
     tz_env = _normalize_timezone_name(os.environ.get("TZ", ""))
     if tz_env:
@@ -479,15 +490,15 @@ def _detect_local_timezone() -> str:
         if timezone:
             return timezone
 
-    timedatectl = shutil.which("timedatectl")
+    timedatectl = _which("timedatectl")
     if timedatectl:
         result = subprocess.run(
             [timedatectl, "show", "--property=Timezone", "--value"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
-        timezone = _normalize_timezone_name(result.stdout.strip())
+        timezone = _normalize_timezone_name(result.stdout.decode(errors="replace").strip())
         if timezone:
             return timezone
 
@@ -790,6 +801,8 @@ def setup(
         console.print(
             "\nStarting operator now. DM the Slack bot or @mention it in a channel where it is invited."
         )
+        from operator_ai.main import async_main
+
         asyncio.run(async_main())
         return
 
@@ -808,23 +821,32 @@ def setup(
 def main(ctx: typer.Context) -> None:
     """Operator - local AI agent runtime."""
     if ctx.invoked_subcommand is None:
+        from operator_ai.main import async_main
+
         asyncio.run(async_main())
 
 
 # ── Service commands ─────────────────────────────────────────
 
 
+@lru_cache(maxsize=1)
 def _find_operator_bin() -> str:
     """Find the operator executable path."""
-    path = shutil.which("operator")
+    path = _which("operator")
     if path:
         return path
     # Fallback: assume it's the current Python's entry point
     return str(Path(sys.executable).parent / "operator")
 
 
+def _service_path() -> str:
+    """Current PATH with duplicate entries dropped, keeping first-seen precedence."""
+    entries = os.environ.get("PATH", "/usr/bin:/bin").split(os.pathsep)
+    return os.pathsep.join(dict.fromkeys(e for e in entries if e))
+
+
 def _generate_plist(bin_path: str) -> str:
-    current_path = os.environ.get("PATH", "/usr/bin:/bin")
+    current_path = _service_path()
     return textwrap.dedent(f"""\
         <?xml version="1.0" encoding="UTF-8"?>
         <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
@@ -847,17 +869,17 @@ def _generate_plist(bin_path: str) -> str:
             <key>KeepAlive</key>
             <true/>
             <key>StandardOutPath</key>
-            <string>{LOG_DIR / "operator.log"}</string>
+            <string>{LOG_FILE}</string>
             <key>StandardErrorPath</key>
-            <string>{LOG_DIR / "operator.log"}</string>
+            <string>{LOG_FILE}</string>
             <key>WorkingDirectory</key>
-            <string>{Path.home()}</string>
+            <string>{_HOME}</string>
         </dict>
         </plist>""")
 
 
 def _generate_systemd_unit(bin_path: str) -> str:
-    current_path = os.environ.get("PATH", "/usr/bin:/bin")
+    current_path = _service_path()
     return textwrap.dedent(f"""\
         [Unit]
         Description=Operator local AI agent runtime
@@ -867,9 +889,9 @@ def _generate_systemd_unit(bin_path: str) -> str:
         Environment=PATH={current_path}
         Restart=on-failure
         RestartSec=5
-        StandardOutput=append:{LOG_DIR / "operator.log"}
-        StandardError=append:{LOG_DIR / "operator.log"}
-        WorkingDirectory={Path.home()}
+        StandardOutput=append:{LOG_FILE}
+        StandardError=append:{LOG_FILE}
+        WorkingDirectory={_HOME}
 
         [Install]
         WantedBy=default.target""")
@@ -887,7 +909,8 @@ def service_install() -> None:
         if _PLIST_PATH.exists():
             subprocess.run(
                 ["launchctl", "unload", str(_PLIST_PATH)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
         _PLIST_PATH.write_text(_generate_plist(bin_path))
         subprocess.run(["launchctl", "load", str(_PLIST_PATH)], check=True)
@@ -911,8 +934,7 @@ def service_uninstall() -> None:
         else:
             print("Service not installed.")
     else:
-        subprocess.run(["systemctl", "--user", "disable", _SYSTEMD_UNIT], check=False)
-        subprocess.run(["systemctl", "--user", "stop", _SYSTEMD_UNIT], check=False)
+        subprocess.run(["systemctl", "--user", "disable", "--now", _SYSTEMD_UNIT], check=False)
         if _SYSTEMD_PATH.exists():
             _SYSTEMD_PATH.unlink()
             subprocess.run(["systemctl", "--user", "daemon-reload"], check=False)
@@ -959,13 +981,12 @@ def service_status() -> None:
         result = subprocess.run(
             ["launchctl", "list", _LAUNCHD_LABEL],
             capture_output=True,
-            text=True,
         )
         if result.returncode != 0:
             print("Service not loaded.")
             raise typer.Exit(code=1)
         # Parse the dict-style output from `launchctl list <label>`
-        output = result.stdout
+        output = result.stdout.decode(errors="replace")
         pid_match = re.search(r'"PID"\s*=\s*(\d+)', output)
         exit_match = re.search(r'"LastExitStatus"\s*=\s*(\d+)', output)
         last_exit = exit_match.group(1) if exit_match else "?"
@@ -977,9 +998,8 @@ def service_status() -> None:
         result = subprocess.run(
             ["systemctl", "--user", "status", _SYSTEMD_UNIT],
             capture_output=True,
-            text=True,
         )
-        print(result.stdout.strip())
+        print(result.stdout.decode(errors="replace").strip())
         if result.returncode != 0:
             raise typer.Exit(code=1)
 
@@ -1171,6 +1191,10 @@ def job_run(
     name: str = typer.Argument(help="Job name to run immediately."),
 ) -> None:
     """Trigger a job immediately (outside the cron schedule)."""
+    from operator_ai.jobs import run_job_now
+    from operator_ai.memory import MemoryStore
+    from operator_ai.transport.cli import CliTransport
+
     _setup_cli_logging()
     cli_logger = logging.getLogger("operator.cli")
 
@@ -1472,8 +1496,7 @@ def skills_reset(
 
     if name is None and not all_skills:
         console.print("Available bundled skills:\n")
-        for n in bundled:
-            console.print(f"  {n}")
+        console.print("\n".join(f"  {n}" for n in bundled))
         console.print("\nUsage: [bold]operator skills reset <name>[/bold] or [bold]--all[/bold]")
         raise typer.Exit()
 
@@ -1653,6 +1676,8 @@ def user_remove_role(
 @app.command("tools")
 def show_tools() -> None:
     """List all registered built-in tools."""
+    from operator_ai.tools.registry import get_tools
+
     tools = get_tools()
     table = Table(show_header=True, show_edge=False, pad_edge=False)
     table.add_column("Tool", style="bold")
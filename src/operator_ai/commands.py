@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from operator_ai.config import SKILLS_DIR, Config
@@ -69,6 +70,13 @@ async def dispatch_command(cmd_name: str, ctx: CommandContext) -> str:
 
 @command("help", "List available commands")
 async def cmd_help(ctx: CommandContext) -> str:
+    return _help_text()
+
+
+@cache
+def _help_text() -> str:
+    # Commands register at import time, so the listing never changes after
+    # the first !help.
     lines = ["*Available commands:*\n"]
     for name, info in COMMANDS.items():
         lines.append(f"`!{name}` — {info.description}")
@@ -130,14 +138,23 @@ def _list_jobs(ctx: CommandContext) -> str:
     return "\n".join(lines)
 
 
+# Chat-disabled subcommand actions -> fixed reply, resolved with one dict lookup.
+_JOB_ACTION_REPLIES: dict[str, str] = {
+    "enable": "Job enable/disable is disabled in chat. Use `operator job enable <name>`.",
+    "disable": "Job enable/disable is disabled in chat. Use `operator job disable <name>`.",
+}
+_MEMORY_ACTION_REPLIES: dict[str, str] = dict.fromkeys(
+    ("clear", "delete"),
+    "Memory mutation is disabled in chat. Use CLI tooling for memory updates.",
+)
+
+
 async def _job_subcommand(ctx: CommandContext) -> str:
     job_name = ctx.args[0]
-    action = ctx.args[1].lower() if len(ctx.args) > 1 else None
-
-    if action == "enable":
-        return "Job enable/disable is disabled in chat. Use `operator job enable <name>`."
-    elif action == "disable":
-        return "Job enable/disable is disabled in chat. Use `operator job disable <name>`."
+    if len(ctx.args) > 1:
+        reply = _JOB_ACTION_REPLIES.get(ctx.args[1].lower())
+        if reply is not None:
+            return reply
 
     # Show single job details
     job = find_job_spec(job_name, _JOBS_DIR)
@@ -221,11 +238,7 @@ def _list_pinned_memories(ctx: CommandContext) -> str:
 
 async def _memories_subcommand(ctx: CommandContext) -> str:
     action = ctx.args[0].lower()
-
-    if action == "clear":
-        return "Memory mutation is disabled in chat. Use CLI tooling for memory updates."
-
-    if action == "delete":
-        return "Memory mutation is disabled in chat. Use CLI tooling for memory updates."
-
+    reply = _MEMORY_ACTION_REPLIES.get(action)
+    if reply is not None:
+        return reply
     return f"Unknown memories subcommand: `{action}`. Use `clear` or `delete <id>`."
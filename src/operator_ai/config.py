@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 from collections.abc import Callable
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -21,6 +22,8 @@ class ConfigError(Exception):
 OPERATOR_DIR = Path.home() / ".operator"
 CONFIG_PATH = OPERATOR_DIR / "operator.yaml"
 SKILLS_DIR = OPERATOR_DIR / "skills"
+AGENTS_DIR = OPERATOR_DIR / "agents"
+SHARED_DIR = OPERATOR_DIR / "shared"
 
 # Expose the resolved base directory as an environment variable so that
 # run_shell commands, skill scripts, and job hooks can reference paths
@@ -106,14 +109,33 @@ class TransportConfig(StrictConfigModel):
         return value
 
 
+def _allow_filter(names: list[str] | Literal["*"] | None) -> Callable[[str], bool] | None:
+    if names is None or names == "*":
+        return None
+    return frozenset(names).__contains__
+
+
 class PermissionsConfig(StrictConfigModel):
     tools: list[str] | Literal["*"] | None = None  # None = no block = full access
     skills: list[str] | Literal["*"] | None = None
 
+    # Built once per loaded config; every request for the agent reuses them.
+    @cached_property
+    def tool_filter(self) -> Callable[[str], bool] | None:
+        return _allow_filter(self.tools)
+
+    @cached_property
+    def skill_filter(self) -> Callable[[str], bool] | None:
+        return _allow_filter(self.skills)
+
 
 class RoleConfig(StrictConfigModel):
     agents: list[str]
 
+    @cached_property
+    def agent_set(self) -> frozenset[str]:
+        return frozenset(self.agents)
+
 
 class AgentConfig(StrictConfigModel):
     models: list[str] | None = None
@@ -237,7 +259,7 @@ class Config(StrictConfigModel):
         return self.defaults.max_output_tokens
 
     def agent_dir(self, agent_name: str) -> Path:
-        return OPERATOR_DIR / "agents" / agent_name
+        return AGENTS_DIR / agent_name
 
     def agent_workspace(self, agent_name: str) -> Path:
         return self.agent_dir(agent_name) / "workspace"
@@ -252,7 +274,7 @@ class Config(StrictConfigModel):
 
     @property
     def shared_dir(self) -> Path:
-        return OPERATOR_DIR / "shared"
+        return SHARED_DIR
 
     def default_agent(self) -> str:
         """Return the first agent name from config, or 'default'."""
@@ -271,22 +293,14 @@ class Config(StrictConfigModel):
         agent = self.agents.get(agent_name)
         if not agent or not agent.permissions:
             return None
-        tools = agent.permissions.tools
-        if tools is None or tools == "*":
-            return None
-        allowed = set(tools)
-        return lambda name: name in allowed
+        return agent.permissions.tool_filter
 
     def agent_skill_filter(self, agent_name: str) -> Callable[[str], bool] | None:
         """Return a predicate that returns True if a skill name is allowed, or None for no filtering."""
         agent = self.agents.get(agent_name)
         if not agent or not agent.permissions:
             return None
-        skills = agent.permissions.skills
-        if skills is None or skills == "*":
-            return None
-        allowed = set(skills)
-        return lambda name: name in allowed
+        return agent.permissions.skill_filter
 
 
 def ensure_shared_symlink(workspace: Path, shared: Path) -> None:
@@ -327,21 +341,36 @@ def _load_env_file(env_path: str, *, base_dir: Path | None = None) -> None:
             os.environ.setdefault(key, value)
 
 
+# path -> (mtime_ns, size, parsed config); reused until the file changes on disk
+_config_cache: dict[Path, tuple[int, int, Config]] = {}
+
+
 def load_config(path: Path | None = None) -> Config:
     path = path or CONFIG_PATH
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise ConfigError(
             f'Config not found: {path}\nCreate it with at least:\n  defaults:\n    models:\n      - "openai/gpt-4.1"'
-        )
-    try:
-        with path.open() as f:
-            data: dict[str, Any] = yaml.safe_load(f) or {}
-        config = Config(**data)
-    except yaml.YAMLError as e:
-        raise ConfigError(f"Invalid YAML in {path}: {e}") from e
-    except Exception as e:
-        raise ConfigError(f"Invalid config in {path}: {e}") from e
-
+        ) from None
+    cached = _config_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        config = cached[2]
+    else:
+        try:
+            with path.open() as f:
+                data: dict[str, Any] = yaml.safe_load(f) or {}
+            config = Config(**data)
+        except yaml.YAMLError as e:
+            raise ConfigError(f"Invalid YAML in {path}: {e}") from e
+        except Exception as e:
+            raise ConfigError(f"Invalid config in {path}: {e}") from e
+        _config_cache[path] = (st.st_mtime_ns, st.st_size, config)
+
+    # The env file is re-read even on a cache hit so keys added to .env while
+    # the service runs are picked up, as they were before the parse was cached.
     if config.runtime.env_file:
         _load_env_file(config.runtime.env_file, base_dir=path.parent)
+    # Shared across callers (and so are its cached filter properties); treat it
+    # as read-only.
     return config
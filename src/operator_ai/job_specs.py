@@ -30,31 +30,49 @@ def scan_job_specs(jobs_dir: Path = JOBS_DIR) -> list[JobSpec]:
 
     specs: list[JobSpec] = []
     for job_md in sorted(jobs_dir.glob("*/JOB.md")):
-        try:
-            frontmatter = parse_frontmatter(job_md.read_text())
-        except Exception:
-            logger.warning("Failed to parse job frontmatter in %s", job_md)
-            continue
-
-        if not frontmatter:
-            continue
-
-        specs.append(
-            JobSpec(
-                name=frontmatter.get("name", job_md.parent.name),
-                schedule=frontmatter.get("schedule", ""),
-                agent=frontmatter.get("agent", ""),
-                model=frontmatter.get("model", ""),
-                enabled=bool(frontmatter.get("enabled", True)),
-                description=frontmatter.get("description", ""),
-                path=str(job_md),
-            )
-        )
+        spec = _read_job_spec(job_md)
+        if spec is not None:
+            specs.append(spec)
 
     return specs
 
 
+def _read_job_spec(job_md: Path) -> JobSpec | None:
+    try:
+        frontmatter = parse_frontmatter(job_md.read_text())
+    except Exception:
+        logger.warning("Failed to parse job frontmatter in %s", job_md)
+        return None
+
+    if not frontmatter:
+        return None
+
+    return JobSpec(
+        name=frontmatter.get("name", job_md.parent.name),
+        schedule=frontmatter.get("schedule", ""),
+        agent=frontmatter.get("agent", ""),
+        model=frontmatter.get("model", ""),
+        enabled=bool(frontmatter.get("enabled", True)),
+        description=frontmatter.get("description", ""),
+        path=str(job_md),
+    )
+
+
 def find_job_spec(name: str, jobs_dir: Path = JOBS_DIR) -> JobSpec | None:
+    """Find a job by its frontmatter name.
+
+    If several JOB.md files declare the same name, the one in the directory
+    named after the job wins, matching how the manage_job tool addresses jobs
+    by directory. Otherwise the first match in directory order is returned.
+    """
+    # Job directories are normally named after the job, so read that one file
+    # before falling back to parsing every JOB.md.
+    if name and name not in (".", "..") and Path(name).name == name:
+        direct = jobs_dir / name / "JOB.md"
+        if direct.is_file():
+            spec = _read_job_spec(direct)
+            if spec is not None and spec.name == name:
+                return spec
     for spec in scan_job_specs(jobs_dir):
         if spec.name == name:
             return spec
@@ -8,11 +8,13 @@ import time
 from collections.abc import Coroutine
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from croniter import croniter
 
+from operator_ai.agents import AgentInfo, scan_agents
 from operator_ai.config import OPERATOR_DIR, Config
 from operator_ai.job_specs import JOBS_DIR
 from operator_ai.log_context import new_run_id, set_run_context
@@ -22,9 +24,16 @@ from operator_ai.prompts import assemble_system_prompt, load_prompt
 from operator_ai.skills import extract_body, parse_frontmatter
 from operator_ai.store import DB_PATH, Store
 from operator_ai.transport.base import Transport
+from operator_ai.utils import byte_cap, read_capped, subdir_names
 
 logger = logging.getLogger("operator.jobs")
 
+# Hook output lands in the job prompt and the log, so it is bounded like tool output.
+MAX_HOOK_OUTPUT = 16_384
+_HOOK_OUTPUT_BYTES = byte_cap(MAX_HOOK_OUTPUT)
+# Hook output echoed into the run log is a short preview cut from the raw bytes.
+_HOOK_LOG_PREVIEW_BYTES = 200
+
 
 @dataclass
 class Job:
@@ -40,27 +49,33 @@ class Job:
     enabled: bool = True
 
 
+@lru_cache(maxsize=256)
+def _is_valid_schedule(schedule: str) -> bool:
+    # Every tick rescans all jobs; parse each distinct expression only once.
+    return croniter.is_valid(schedule)
+
+
 def scan_jobs() -> list[Job]:
     """Scan jobs/*/JOB.md, parse frontmatter, validate schedule, return jobs."""
     jobs: list[Job] = []
-    if not JOBS_DIR.is_dir():
-        return jobs
-
-    for job_dir in sorted(JOBS_DIR.iterdir()):
-        if not job_dir.is_dir():
-            continue
+    for name in subdir_names(JOBS_DIR):
+        job_dir = JOBS_DIR / name
         job_md = job_dir / "JOB.md"
-        if not job_md.exists():
-            continue
         try:
             text = job_md.read_text()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except Exception as e:
+            logger.warning("Failed to parse %s: %s", job_md, e)
+            continue
+        try:
             fm = parse_frontmatter(text)
             if not fm:
                 logger.warning("No frontmatter in %s, skipping", job_md)
                 continue
 
             schedule = fm.get("schedule", "")
-            if not schedule or not croniter.is_valid(schedule):
+            if not isinstance(schedule, str) or not _is_valid_schedule(schedule):
                 logger.warning("Invalid schedule '%s' in %s, skipping", schedule, job_md)
                 continue
 
@@ -91,6 +106,23 @@ def scan_jobs() -> list[Job]:
     return jobs
 
 
+async def _communicate_capped(proc: asyncio.subprocess.Process, stdin_data: bytes) -> bytes:
+    """Like ``communicate()``, but only the first _HOOK_OUTPUT_BYTES of stdout are kept."""
+
+    async def _feed() -> None:
+        assert proc.stdin is not None
+        if stdin_data:
+            # A hook may exit without reading its input; that is not an error.
+            with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                proc.stdin.write(stdin_data)
+                await proc.stdin.drain()
+        proc.stdin.close()
+
+    _, stdout = await asyncio.gather(_feed(), read_capped(proc.stdout, _HOOK_OUTPUT_BYTES))
+    await proc.wait()
+    return stdout
+
+
 async def _run_hook(
     job: Job,
     hook_name: str,
@@ -133,19 +165,24 @@ async def _run_hook(
             cwd=str(job.job_dir),
             env=env,
         )
-        stdout, _ = await asyncio.wait_for(
-            proc.communicate(input=stdin_data.encode() if stdin_data else None),
+        stdout = await asyncio.wait_for(
+            _communicate_capped(proc, stdin_data.encode()),
             timeout=timeout,
         )
         output = stdout.decode(errors="replace")
+        if len(output) > MAX_HOOK_OUTPUT:
+            output = output[:MAX_HOOK_OUTPUT] + "\n[truncated — hook output exceeded 16KB]"
         elapsed = round(time.time() - hook_start, 1)
+        preview = stdout[:_HOOK_LOG_PREVIEW_BYTES].decode(errors="replace").strip()
+        if preview and len(stdout) > _HOOK_LOG_PREVIEW_BYTES:
+            preview += "…"
         logger.info(
             "Hook %s for job '%s' exited %d in %.1fs%s",
             hook_name,
             job.name,
             proc.returncode or 0,
             elapsed,
-            f" — {output.strip()}" if output.strip() else "",
+            f" — {preview}" if preview else "",
         )
         return proc.returncode or 0, output
     except TimeoutError:
@@ -199,6 +236,7 @@ async def _build_job_prompt(
     prerun_output: str,
     transport: Transport | None,
     memory_store: MemoryStore | None = None,
+    available_agents: list[AgentInfo] | None = None,
 ) -> str:
     """Assemble the system prompt for a job execution."""
     workspace = config.agent_workspace(agent_name)
@@ -226,6 +264,7 @@ async def _build_job_prompt(
         pinned_memory_lines=pinned_lines,
         transport_extra=transport.get_prompt_extra() if transport else "",
         skill_filter=config.agent_skill_filter(agent_name),
+        available_agents=available_agents,
     )
 
 
@@ -265,8 +304,13 @@ async def _execute_job(
     transports: dict[str, Transport],
     store: Store,
     memory_store: MemoryStore | None = None,
+    available_agents: list[AgentInfo] | None = None,
 ) -> None:
-    """Full execution: prerun gate -> agent -> postrun -> state."""
+    """Full execution: prerun gate -> agent -> postrun -> state.
+
+    ``available_agents`` lets a scheduler tick share one agent scan across
+    every job it fires; None scans on demand.
+    """
     start_time = time.time()
     agent_name = job.agent or config.default_agent()
     set_run_context(agent=agent_name, run_id=new_run_id())
@@ -310,6 +354,7 @@ async def _execute_job(
             prerun_output,
             transport,
             memory_store=memory_store,
+            available_agents=available_agents,
         )
         store.ensure_conversation(
             conversation_id=conversation_id,
@@ -437,8 +482,11 @@ class JobRunner:
 
     async def _tick(self) -> None:
         now = datetime.now(self._config.tz)
-        jobs = scan_jobs()
+        # Reading and YAML-parsing every JOB.md is blocking disk work; keep it
+        # off the event loop so chat traffic is not stalled once a minute.
+        jobs = await asyncio.to_thread(scan_jobs)
 
+        due: list[Job] = []
         for job in jobs:
             if not job.enabled or not croniter.match(job.schedule, now):
                 continue
@@ -449,7 +497,14 @@ class JobRunner:
                 state.skip_count += 1
                 self._store.save_job_state(job.name, state)
                 continue
+            due.append(job)
 
+        if not due:
+            return
+        # Every job fired in this tick sees the same agent roster, so scan it
+        # once instead of once per job prompt.
+        agents = await asyncio.to_thread(scan_agents)
+        for job in due:
             logger.info("Firing job '%s' (schedule: %s)", job.name, job.schedule)
             self._spawn(
                 job.name,
@@ -459,6 +514,7 @@ class JobRunner:
                     self._transports,
                     self._store,
                     self._memory_store,
+                    available_agents=agents,
                 ),
             )
 
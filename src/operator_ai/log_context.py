@@ -19,6 +19,9 @@ class RunContext:
         return f"[{self.agent}:{self.run_id}{depth_suffix}]"
 
 
+# Third-party loggers capped at WARNING for both the service and CLI commands.
+NOISY_LOGGERS = ("httpx", "httpcore", "slack_bolt", "slack_sdk", "litellm", "openai")
+
 _run_context: ContextVar[RunContext | None] = ContextVar("_run_context", default=None)
 
 
@@ -39,3 +42,9 @@ class RunContextFilter(logging.Filter):
         ctx = _run_context.get()
         record.run_ctx = f"{ctx} " if ctx else ""  # type: ignore[attr-defined]
         return True
+
+
+def quiet_noisy_loggers() -> None:
+    """Raise noisy library loggers to WARNING so their debug chatter is never built."""
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
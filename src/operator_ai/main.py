@@ -9,6 +9,7 @@ import logging.handlers
 import os
 import signal
 import sys
+import time
 from contextlib import suppress
 from pathlib import Path
 
@@ -18,14 +19,19 @@ from operator_ai.agent import run_agent
 from operator_ai.commands import CommandContext, dispatch_command
 from operator_ai.config import OPERATOR_DIR, Config, ConfigError, RoleConfig, load_config
 from operator_ai.jobs import JobRunner
-from operator_ai.log_context import RunContextFilter, new_run_id, set_run_context
+from operator_ai.log_context import (
+    RunContextFilter,
+    new_run_id,
+    quiet_noisy_loggers,
+    set_run_context,
+)
 from operator_ai.memory import MemoryCleaner, MemoryHarvester, MemoryStore, format_retention_mix
 from operator_ai.message_timestamps import attach_message_created_at
 from operator_ai.messages import trim_incomplete_tool_turns
 from operator_ai.prompts import SKILLS_DIR, assemble_system_prompt
 from operator_ai.skills import install_bundled_skills
 from operator_ai.status import StatusIndicator
-from operator_ai.store import Store, get_store
+from operator_ai.store import Store, get_store, reset_store
 from operator_ai.tools import kv as kv_tools
 from operator_ai.tools import memory as memory_tools
 from operator_ai.tools import messaging
@@ -85,21 +91,57 @@ def _conversation_memory_scopes(
 
 def resolve_allowed_agents(
     roles: list[str], config_roles: dict[str, RoleConfig]
-) -> set[str] | None:
+) -> frozenset[str] | None:
     """Return the set of agent names a user may access, or None if admin (all access)."""
     if "admin" in roles:
         return None
-    allowed: set[str] = set()
-    for role in roles:
-        role_cfg = config_roles.get(role)
-        if role_cfg:
-            allowed.update(role_cfg.agents)
-    return allowed
+    sets = [config_roles[role].agent_set for role in roles if role in config_roles]
+    if len(sets) == 1:
+        # Common case: reuse the role's frozen set instead of copying it.
+        return sets[0]
+    return frozenset().union(*sets)
 
 
 _IMAGE_TYPES = frozenset({"image/png", "image/jpeg", "image/gif", "image/webp"})
 MAX_INLINE_SIZE = 5 * 1024 * 1024  # 5 MB — larger images saved to disk instead
 MAX_DOWNLOAD_SIZE = 50 * 1024 * 1024  # 50 MB — skip oversized files
+MAX_CONCURRENT_DOWNLOADS = 4  # attachments fetched at once per message
+_MAX_UPLOAD_SUFFIX = 9  # numbered duplicates before switching to random tags
+
+
+def _save_upload(uploads_dir: Path, filename: str, data: bytes) -> Path:
+    safe_name = Path(filename).name or "unnamed"
+    dest = uploads_dir / safe_name
+    # Avoid overwriting — append suffix if needed. touch(exist_ok=False) claims
+    # the name with O_EXCL, so concurrent uploads can never pick the same one.
+    stem, suffix = dest.stem, dest.suffix
+    counter = 1
+    while True:
+        try:
+            dest.touch(exist_ok=False)
+            break
+        except FileNotFoundError:
+            # Only the first upload into a workspace pays for the mkdir.
+            uploads_dir.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
+            # Readable _1, _2, ... for the first few copies; past that a random
+            # tag, so a much-reused name (image.png) never probes more than
+            # _MAX_UPLOAD_SUFFIX existing files.
+            tag = counter if counter <= _MAX_UPLOAD_SUFFIX else os.urandom(4).hex()
+            dest = uploads_dir / f"{stem}_{tag}{suffix}"
+            counter += 1
+    # Write beside the target and rename into place so the agent never sees a
+    # half-written upload under its final name.
+    part = dest.with_name(f"{dest.name}.part")
+    try:
+        part.write_bytes(data)
+        part.replace(dest)
+    except BaseException:
+        # Don't leave the reserved name (or a partial write) in the workspace.
+        part.unlink(missing_ok=True)
+        dest.unlink(missing_ok=True)
+        raise
+    return dest
 
 
 async def process_attachments(
@@ -115,6 +157,27 @@ async def process_attachments(
     blocks: list[dict] = []
     uploads_dir = workspace / "uploads"
 
+    # Each download is buffered whole, so cap how many are in flight at once.
+    limit = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def _download(att: Attachment) -> bytes | None:
+        try:
+            async with limit:
+                return await transport.download_file(att)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Failed to download attachment %s", att.filename, exc_info=True)
+            return None
+
+    # Downloads are independent round-trips, so fetch them concurrently; blocks
+    # are still emitted in the original attachment order.
+    downloads = iter(
+        await asyncio.gather(
+            *(_download(att) for att in attachments if att.size <= MAX_DOWNLOAD_SIZE)
+        )
+    )
+
     for att in attachments:
         if att.size > MAX_DOWNLOAD_SIZE:
             blocks.append(
@@ -122,12 +185,8 @@ async def process_attachments(
             )
             continue
 
-        try:
-            data = await transport.download_file(att)
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            logger.warning("Failed to download attachment %s", att.filename, exc_info=True)
+        data = next(downloads)
+        if data is None:
             blocks.append({"type": "text", "text": f"[failed to download: {att.filename}]"})
             continue
 
@@ -140,18 +199,9 @@ async def process_attachments(
                 }
             )
         else:
-            # Save to workspace/uploads/ so the agent can access it
-            uploads_dir.mkdir(parents=True, exist_ok=True)
-            safe_name = Path(att.filename).name or "unnamed"
-            dest = uploads_dir / safe_name
-            # Avoid overwriting — append suffix if needed
-            if dest.exists():
-                stem, suffix = dest.stem, dest.suffix
-                counter = 1
-                while dest.exists():
-                    dest = uploads_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
-            dest.write_bytes(data)
+            # Save to workspace/uploads/ so the agent can access it. Uploads can
+            # be tens of MB, so the disk write runs off the event loop.
+            dest = await asyncio.to_thread(_save_upload, uploads_dir, att.filename, data)
             blocks.append(
                 {
                     "type": "text",
@@ -164,7 +214,31 @@ async def process_attachments(
     return blocks
 
 
+def _merge_text_blocks(blocks: list[dict]) -> list[dict]:
+    """Collapse runs of adjacent text blocks into one newline-joined block."""
+    merged: list[dict] = []
+    text_buf: list[str] = []
+    for block in blocks:
+        if block.get("type") == "text":
+            text_buf.append(block["text"])
+            continue
+        if text_buf:
+            merged.append({"type": "text", "text": "\n".join(text_buf)})
+            text_buf = []
+        merged.append(block)
+    if text_buf:
+        merged.append({"type": "text", "text": "\n".join(text_buf)})
+    return merged
+
+
 class ConversationRuntime:
+    """Per-conversation admission state: a single run slot plus its cancel signal.
+
+    Deliberately lock-free. The slot is a flag flipped by ``try_claim`` and
+    ``release``, so ``!stop`` and status checks read ``busy`` or set
+    ``cancelled`` without queueing behind the run that holds the slot.
+    """
+
     def __init__(self) -> None:
         self._active = False
         self.cancelled = asyncio.Event()
@@ -255,25 +329,28 @@ class Dispatcher:
         self.runtimes = runtimes
         self.memory_store = memory_store
         self.transports: dict[str, Transport] = {}
-        self._seen_messages: collections.OrderedDict[str, float] = collections.OrderedDict()
+        # transport_name -> message_id -> first-seen loop time, oldest first
+        self._seen_messages: dict[str, collections.OrderedDict[str, float]] = {}
 
     def register_transport(self, transport: Transport) -> None:
         self.transports[transport.name] = transport
 
     def _dedup(self, msg: IncomingMessage) -> bool:
         """Return True if this message_id was already dispatched recently."""
-        key = f"{msg.transport_name}:{msg.message_id}"
-        now = asyncio.get_running_loop().time()
-        # Evict stale entries
-        while self._seen_messages:
-            oldest_key, oldest_time = next(iter(self._seen_messages.items()))
-            if now - oldest_time > self._SEEN_TTL:
-                self._seen_messages.pop(oldest_key)
-            else:
+        now = time.monotonic()  # the loop clock, without a running-loop lookup
+        seen = self._seen_messages.get(msg.transport_name)
+        if seen is None:
+            seen = self._seen_messages[msg.transport_name] = collections.OrderedDict()
+        # Evict stale entries (oldest first, so stop at the first fresh one)
+        cutoff = now - self._SEEN_TTL
+        while seen:
+            oldest_key = next(iter(seen))
+            if seen[oldest_key] >= cutoff:
                 break
-        if key in self._seen_messages:
+            del seen[oldest_key]
+        if msg.message_id in seen:
             return True
-        self._seen_messages[key] = now
+        seen[msg.message_id] = now
         return False
 
     async def handle_message(self, msg: IncomingMessage) -> None:
@@ -349,15 +426,27 @@ class Dispatcher:
             },
         )
         self.store.ensure_system_message(conversation_id, system_prompt)
-        self.store.index_platform_message(msg.transport_name, msg.root_message_id, conversation_id)
+        indexed_ids = [msg.root_message_id]
         if msg.message_id and msg.message_id != msg.root_message_id:
-            self.store.index_platform_message(msg.transport_name, msg.message_id, conversation_id)
+            indexed_ids.append(msg.message_id)
+        self.store.index_platform_messages(msg.transport_name, indexed_ids, conversation_id)
 
         # Handle !commands before touching the LLM
         if msg.text.startswith("!"):
             await self._handle_command(msg, transport, runtime, conversation_id)
             return
 
+        await self._run_claimed(msg, transport, runtime, conversation_id, agent_name)
+
+    async def _run_claimed(
+        self,
+        msg: IncomingMessage,
+        transport: Transport,
+        runtime: ConversationRuntime,
+        conversation_id: str,
+        agent_name: str,
+    ) -> None:
+        """Run the conversation while holding its runtime slot, or reject if busy."""
         # Claim the conversation — atomic check-and-set (no yield between
         # read and write, so no other task can interleave in asyncio).
         if not runtime.try_claim():
@@ -386,6 +475,7 @@ class Dispatcher:
         agent_name: str,
     ) -> None:
         messages = self.store.load_messages(conversation_id)
+        workspace = self.config.agent_workspace(agent_name)
 
         user_ctx = get_user_context()
         username = user_ctx.username if user_ctx else ""
@@ -411,16 +501,17 @@ class Dispatcher:
         if self.memory_store:
             scopes = _conversation_memory_scopes(
                 user_id=username,
-                agent_name=transport.agent_name,
+                agent_name=agent_name,
                 is_private=msg.is_private,
             )
             try:
                 relevant = await self.memory_store.search(msg.text, scopes)
-                logger.info(
-                    "memory injection: injected=%d retention_mix=%s",
-                    len(relevant),
-                    format_retention_mix(relevant),
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "memory injection: injected=%d retention_mix=%s",
+                        len(relevant),
+                        format_retention_mix(relevant),
+                    )
                 if relevant:
                     lines = [r["content"] for r in relevant]
                     context_parts.append(
@@ -434,23 +525,18 @@ class Dispatcher:
             except Exception:
                 logger.exception("Memory search failed")
 
-        # Prepend to user message text
-        msg_text = msg.text
-        if context_parts:
-            msg_text = "\n\n".join(context_parts) + "\n\n" + msg.text
+        # Prepend to user message text (one join, no intermediate strings)
+        msg_text = "\n\n".join([*context_parts, msg.text]) if context_parts else msg.text
 
         # Build user message — multimodal if attachments present
         if msg.attachments:
-            workspace_path = self.config.agent_workspace(agent_name)
-            attachment_blocks = await process_attachments(
-                msg.attachments, transport, workspace_path
-            )
+            attachment_blocks = await process_attachments(msg.attachments, transport, workspace)
             content_blocks: list[dict] = []
             if msg_text:
                 content_blocks.append({"type": "text", "text": msg_text})
             content_blocks.extend(attachment_blocks)
             user_message: dict = attach_message_created_at(
-                {"role": "user", "content": content_blocks},
+                {"role": "user", "content": _merge_text_blocks(content_blocks)},
                 created_at=msg.created_at,
             )
         else:
@@ -469,26 +555,28 @@ class Dispatcher:
                 "thread_id": msg.root_message_id,
             }
         )
-        kv_tools.configure({"agent_name": transport.agent_name})
+        kv_tools.configure({"agent_name": agent_name})
 
         if self.memory_store:
             memory_tools.configure(
                 {
                     "memory_store": self.memory_store,
                     "user_id": username,
-                    "agent_name": transport.agent_name,
+                    "agent_name": agent_name,
                     "allow_user_scope": msg.is_private,
                 }
             )
 
         set_skill_filter(self.config.agent_skill_filter(agent_name))
 
-        msg_count = sum(1 for m in messages if m.get("role") == "user")
-        logger.info("conversation %s — message #%d", conversation_id, msg_count)
+        # Counting walks the whole history, so skip it when INFO is filtered out.
+        if logger.isEnabledFor(logging.INFO):
+            msg_count = sum(1 for m in messages if m.get("role") == "user")
+            logger.info("conversation %s — message #%d", conversation_id, msg_count)
 
         async def on_message(text: str) -> None:
-            preview = text[:25].replace("\n", " ")
-            logger.info("→ %s…", preview)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("→ %s…", text[:25].replace("\n", " "))
             message_id = await transport.send(msg.channel_id, text, thread_id=msg.root_message_id)
             self.store.index_platform_message(msg.transport_name, message_id, conversation_id)
 
@@ -508,7 +596,7 @@ class Dispatcher:
                 messages=messages,
                 models=self.config.agent_models(agent_name),
                 max_iterations=self.config.agent_max_iterations(agent_name),
-                workspace=str(self.config.agent_workspace(agent_name)),
+                workspace=str(workspace),
                 agent_name=agent_name,
                 on_message=on_message,
                 check_cancelled=runtime.check_cancelled,
@@ -586,9 +674,9 @@ class Dispatcher:
         runtime: ConversationRuntime,
         conversation_id: str,
     ) -> None:
-        parts = msg.text.strip().split()
-        cmd_name = parts[0][1:].lower()  # strip "!" prefix
-        args = parts[1:]
+        # split() already drops surrounding whitespace; no separate strip() copy.
+        cmd_word, *args = msg.text.split()
+        cmd_name = cmd_word[1:].lower()  # strip "!" prefix
 
         ctx = CommandContext(
             args=args,
@@ -668,9 +756,7 @@ def _setup_logging() -> None:
         sh.addFilter(ctx_filter)
         root.addHandler(sh)
 
-    # Quiet noisy libs
-    for name in ("httpx", "httpcore", "slack_bolt", "slack_sdk", "litellm", "openai"):
-        logging.getLogger(name).setLevel(logging.WARNING)
+    quiet_noisy_loggers()
 
 
 def _acquire_lock() -> int:
@@ -820,6 +906,9 @@ async def async_main() -> None:
             await transport.stop()
 
         await close_session()
+        # Commits run with synchronous=NORMAL (no per-commit fsync); closing the
+        # last connection checkpoints the WAL so a clean shutdown is durable.
+        reset_store()
         os.close(lock_fd)
 
 
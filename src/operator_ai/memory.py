@@ -6,6 +6,7 @@ import json
 import logging
 import math
 import string
+import time
 from abc import ABC, abstractmethod
 from collections import Counter
 from dataclasses import dataclass
@@ -61,6 +62,21 @@ def _strip_markdown_fence(text: str) -> str:
     return "\n".join(lines).strip()
 
 
+def _join_tail(parts: list[str], max_chars: int) -> str:
+    """Return the last max_chars of "\n".join(parts) without joining every part.
+
+    Walks back from the newest part and joins only the parts that can reach
+    the tail, so a long conversation costs one join of ~max_chars.
+    """
+    start = len(parts)
+    size = -1
+    while start > 0 and size < max_chars:
+        start -= 1
+        size += len(parts[start]) + 1
+    text = "\n".join(parts[start:])
+    return text[-max_chars:] if len(text) > max_chars else text
+
+
 def _expires_at(
     retention: MemoryRetention,
     *,
@@ -358,11 +374,18 @@ class ScheduledWorker(ABC):
     async def _tick_loop(self) -> None:
         set_run_context(agent=self._label)
         try:
+            last_fire: datetime | None = None
+            # One parsed schedule per worker; each cycle just re-bases it.
+            cron = croniter(self._config.schedule, datetime.now(self._tz))
             while True:
-                await asyncio.sleep(60)
+                # Sleep straight through to the next cron fire instead of
+                # waking every minute to ask croniter whether it is time yet.
                 now = datetime.now(self._tz)
-                if not croniter.match(self._config.schedule, now):
-                    continue
+                cron.set_current(max(now, last_fire) if last_fire else now)
+                last_fire = cron.get_next(datetime)
+                # Aware datetimes sharing a zone subtract as wall-clock time,
+                # which is off by the DST shift; compare absolute timestamps.
+                await asyncio.sleep(max(0.0, last_fire.timestamp() - time.time()))
                 try:
                     await self._tick()
                 except Exception as exc:
@@ -413,16 +436,12 @@ class MemoryHarvester(ScheduledWorker):
             is_private = bool(metadata.get("is_private", False))
             agent_name = metadata.get("agent", "")
 
-            messages = self._store.load_messages(conv_id)
-            # Filter to user+assistant text only
-            text_parts = []
-            for msg in messages:
-                role = msg.get("role", "")
-                if role not in ("user", "assistant"):
-                    continue
-                content = msg.get("content", "")
-                if isinstance(content, str) and content.strip():
-                    text_parts.append(f"{role}: {content}")
+            # User+assistant text only; tool payloads are never decoded.
+            text_parts = [
+                f"{role}: {content}"
+                for role, content in self._store.load_text_turns(conv_id)
+                if content.strip()
+            ]
 
             if not text_parts:
                 new_watermark = max(new_watermark, conv["updated_at"])
@@ -431,10 +450,8 @@ class MemoryHarvester(ScheduledWorker):
             conversations_reviewed += 1
             total_messages += len(text_parts)
 
-            conversation_text = "\n".join(text_parts)
             # Truncate to avoid excessive token usage
-            if len(conversation_text) > _MAX_HARVEST_CONVERSATION_CHARS:
-                conversation_text = conversation_text[-_MAX_HARVEST_CONVERSATION_CHARS:]
+            conversation_text = _join_tail(text_parts, _MAX_HARVEST_CONVERSATION_CHARS)
 
             extracted = await self._extract_memories(
                 conversation_text,
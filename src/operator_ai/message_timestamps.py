@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
+from zoneinfo import ZoneInfo
 
 from operator_ai.config import Config
 
@@ -42,10 +44,22 @@ def build_message_timestamp_prefix(
     *,
     created_at: datetime | str,
 ) -> str:
-    current = _parse_created_at(created_at)
+    if isinstance(created_at, str):
+        return _cached_timestamp_prefix(created_at, config.runtime.timezone)
+    return _format_timestamp_prefix(_parse_created_at(created_at), config.tz)
+
+
+@lru_cache(maxsize=1024)
+def _cached_timestamp_prefix(created_at: str, timezone: str) -> str:
+    # History is re-rendered on every model call, so each stored timestamp
+    # would otherwise be re-parsed and re-formatted once per iteration.
+    return _format_timestamp_prefix(_parse_created_at(created_at), ZoneInfo(timezone))
+
+
+def _format_timestamp_prefix(current: datetime | None, tz: ZoneInfo) -> str:
     if current is None:
         return ""
-    local = current.astimezone(config.tz).replace(microsecond=0)
+    local = current.astimezone(tz).replace(microsecond=0)
     return f"[{local.strftime('%A')}, {local.isoformat(timespec='seconds')}]"
 
 
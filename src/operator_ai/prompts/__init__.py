@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from functools import cache
 from pathlib import Path
 
 from operator_ai.agents import AgentInfo, build_agents_prompt, load_agent_body, scan_agents
@@ -17,18 +18,36 @@ SYSTEM_PROMPT_PATH = OPERATOR_DIR / "SYSTEM.md"
 CACHE_BOUNDARY = "\n\n<!-- cache-boundary -->\n\n"
 
 
+@cache
 def load_prompt(name: str) -> str:
-    """Load a bundled prompt template from the prompts/ package directory."""
+    """Load a bundled prompt template from the prompts/ package directory.
+
+    Bundled templates ship with the package and never change at runtime,
+    so each one is read from disk once per process.
+    """
     path = PROMPTS_DIR / name
     return path.read_text().strip()
 
 
+# path -> (mtime_ns, size, stripped text); reused until SYSTEM.md changes on disk
+_system_prompt_cache: dict[Path, tuple[int, int, str]] = {}
+
+
 def load_system_prompt() -> str:
     """Load SYSTEM.md from disk, creating it from the bundled default if missing."""
-    if not SYSTEM_PROMPT_PATH.exists():
-        SYSTEM_PROMPT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        SYSTEM_PROMPT_PATH.write_text(load_prompt("system.md"))
-    return SYSTEM_PROMPT_PATH.read_text().strip()
+    path = SYSTEM_PROMPT_PATH
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(load_prompt("system.md"))
+        st = path.stat()
+    cached = _system_prompt_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    text = path.read_text().strip()
+    _system_prompt_cache[path] = (st.st_mtime_ns, st.st_size, text)
+    return text
 
 
 def load_agent_prompt(config: Config, agent_name: str) -> str:
@@ -10,6 +10,8 @@ from typing import Any
 
 import yaml
 
+from operator_ai.utils import subdir_names
+
 logger = logging.getLogger("operator.skills")
 
 BUNDLED_SKILLS_DIR = Path(__file__).parent / "bundled_skills"
@@ -17,6 +19,8 @@ BUNDLED_SKILLS_DIR = Path(__file__).parent / "bundled_skills"
 # agentskills.io name rules: 1-64 chars, lowercase alphanumeric + hyphens,
 # no leading/trailing/consecutive hyphens.
 _NAME_RE = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
+# Every line boundary str.splitlines() recognizes other than a bare "\n".
+_LINE_BREAK_RE = re.compile("\r\n|[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 @dataclass
@@ -65,17 +69,18 @@ def validate_skill_frontmatter(fm: dict[str, Any], dir_name: str) -> str | None:
 def scan_skills(skills_dir: Path) -> list[SkillInfo]:
     """Scan skills directory, parse SKILL.md frontmatter, return skill metadata."""
     skills: list[SkillInfo] = []
-    if not skills_dir.is_dir():
-        return skills
-
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
+    for name in subdir_names(skills_dir):
+        skill_dir = skills_dir / name
         skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
+        try:
+            text = skill_md.read_text()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except Exception as e:
+            logger.warning("Failed to parse %s: %s", skill_md, e)
             continue
         try:
-            frontmatter = parse_frontmatter(skill_md.read_text())
+            frontmatter = parse_frontmatter(text)
             if frontmatter:
                 metadata = frontmatter.get("metadata") or {}
                 env_vars = metadata.get("env") or []
@@ -192,10 +197,21 @@ def rewrite_frontmatter(path: Path, updates: dict) -> bool:
     fm = parse_frontmatter(text)
     if not fm:
         return False
+    # Nothing to change (e.g. enabling an enabled job): leave the file and its
+    # formatting untouched.
+    if all(key in fm and fm[key] == value for key, value in updates.items()):
+        return True
     fm.update(updates)
     body = extract_body(text)
     new_fm = yaml.dump(fm, default_flow_style=False, sort_keys=False).strip()
-    path.write_text(f"---\n{new_fm}\n---\n\n{body}\n")
+    # Write a sibling and rename over the original so a scheduler tick reading
+    # the file concurrently never sees it half-written. Resolving first keeps a
+    # symlinked file a symlink, and the original's permissions carry over.
+    target = path.resolve()
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_text(f"---\n{new_fm}\n---\n\n{body}\n")
+    shutil.copymode(target, tmp)
+    tmp.replace(target)
     return True
 
 
@@ -206,13 +222,24 @@ def _split_frontmatter(text: str) -> tuple[str, str] | None:
 
     # Allow UTF-8 BOM at file start.
     normalized = text.lstrip("\ufeff")
-    lines = normalized.splitlines()
-    if not lines or lines[0].strip() != "---":
+    # Fold every other line boundary into "\n" so fences split exactly where
+    # splitlines() would split them.
+    normalized = _LINE_BREAK_RE.sub("\n", normalized)
+
+    # Walk line boundaries with find() instead of splitting the whole file:
+    # only the frontmatter lines are inspected and the body is one slice.
+    end = normalized.find("\n")
+    if end < 0 or normalized[:end].strip() != "---":
         return None
 
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            frontmatter = "\n".join(lines[1:idx])
-            body = "\n".join(lines[idx + 1 :])
+    fm_start = start = end + 1
+    while start < len(normalized):
+        end = normalized.find("\n", start)
+        if end < 0:
+            end = len(normalized)
+        if normalized[start:end].strip() == "---":
+            frontmatter = normalized[fm_start : max(fm_start, start - 1)]
+            body = normalized[end + 1 :].removesuffix("\n")
             return frontmatter, body
+        start = end + 1
     return None
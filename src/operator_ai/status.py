@@ -4,9 +4,9 @@ import asyncio
 import contextlib
 import logging
 import random
-import re
 import time
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from operator_ai.utils import truncate
@@ -16,6 +16,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("operator.status")
 
+# Seconds between checks for a changed label.
+TICK_INTERVAL = 1.0
+# Seconds between edits while the action is unchanged (elapsed-only refresh).
+REFRESH_INTERVAL = 5
+# Upper bound on a single status edit before it is abandoned.
+UPDATE_TIMEOUT = 5.0
+
 IDLE_MESSAGES = [
     "Pressing buttons...",
     "Generalizing knowledge...",
@@ -82,9 +89,10 @@ def _basename(path: str) -> str:
     return path.rsplit("/", 1)[-1] if path else "..."
 
 
+@lru_cache(maxsize=128)
 def _humanize(name: str) -> str:
     """Convert function_name to 'Function name...'."""
-    words = re.sub(r"_", " ", name).strip()
+    words = name.replace("_", " ").strip()
     return (words[0].upper() + words[1:] + "...") if words else "Working..."
 
 
@@ -97,6 +105,7 @@ class StatusIndicator:
         self._thread_id = thread_id
         self._message_id: str | None = None
         self._ticker_task: asyncio.Task | None = None
+        self._stopped = asyncio.Event()
         self._start_time: float = 0.0
         self._tool_label: str | None = None
 
@@ -119,19 +128,22 @@ class StatusIndicator:
 
     def set_tool(self, name: str, args: dict[str, Any]) -> None:
         formatter = TOOL_LABELS.get(name)
-        if formatter:
-            self._tool_label = formatter(args)
-        else:
-            self._tool_label = _humanize(name)
+        self._tool_label = formatter(args) if formatter else _humanize(name)
 
     def clear_tool(self) -> None:
         self._tool_label = None
 
     async def stop(self) -> None:
+        """Stop ticking and delete the status message.
+
+        An edit already in flight is allowed to finish first, so this can take
+        up to UPDATE_TIMEOUT seconds when the transport is slow.
+        """
         if self._ticker_task is not None:
-            self._ticker_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._ticker_task
+            # Let the ticker exit on its own so an in-flight update finishes
+            # before the delete below, rather than racing a cancelled RPC.
+            self._stopped.set()
+            await self._ticker_task
             self._ticker_task = None
         if self._message_id is not None:
             try:
@@ -152,16 +164,32 @@ class StatusIndicator:
         return f"_({elapsed}s) {action}_"
 
     async def _tick_loop(self) -> None:
-        try:
-            while True:
-                await asyncio.sleep(1)
-                action = self._tool_label or self._next_idle()
-                text = self._format(action)
-                try:
+        # Each edit is a network round-trip, so only push one when the label
+        # changes or the elapsed counter has gone REFRESH_INTERVAL seconds stale.
+        idle = self._idle_messages[(self._idle_index - 1) % len(self._idle_messages)]
+        last_action = idle
+        last_edit = time.monotonic()
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(TICK_INTERVAL):
+                    await self._stopped.wait()
+            if self._stopped.is_set():
+                return
+            now = time.monotonic()
+            stale = now - last_edit >= REFRESH_INTERVAL
+            if self._tool_label is None and stale:
+                idle = self._next_idle()
+            action = self._tool_label or idle
+            if action == last_action and not stale:
+                continue
+            last_action = action
+            last_edit = now
+            text = self._format(action)
+            try:
+                # Bounded so a stalled edit cannot hold up stop().
+                async with asyncio.timeout(UPDATE_TIMEOUT):
                     await self._transport.update(
                         self._channel_id, self._message_id, text, thread_id=self._thread_id
                     )
-                except Exception:
-                    logger.debug("Failed to update status message", exc_info=True)
-        except asyncio.CancelledError:
-            return
+            except Exception:
+                logger.debug("Failed to update status message", exc_info=True)
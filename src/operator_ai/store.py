@@ -34,6 +34,14 @@ _ACTIVE_MEMORY_CLAUSE_WITH_ALIAS = (
     "(m.pinned = 1 OR m.expires_at IS NULL OR m.expires_at > strftime('%Y-%m-%dT%H:%M:%SZ','now'))"
 )
 _UNSET = object()
+# Compact separators keep stored JSON small. Building the encoder once saves
+# json.dumps constructing a new JSONEncoder per call for non-default settings;
+# both use the same C encoder either way.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+# Rows are always str, so skip json.loads' per-call type/BOM checks and go
+# straight to the C scanner.
+_loads = json.JSONDecoder().decode
+_SYSTEM_MESSAGE_KEYS = frozenset({"role", "content"})
 
 
 def _validate_username(username: str) -> None:
@@ -373,7 +381,7 @@ class Store:
         metadata: dict[str, Any] | None = None,
     ) -> None:
         now = time.time()
-        meta = json.dumps(metadata if metadata is not None else {})
+        meta = _dumps(metadata if metadata is not None else {})
         self._conn.execute(
             """
             INSERT INTO conversations (
@@ -397,41 +405,57 @@ class Store:
             "SELECT id, message_json FROM messages WHERE conversation_id = ? ORDER BY id ASC LIMIT 1",
             (conversation_id,),
         ).fetchone()
+        expected = _dumps({"role": "system", "content": system_prompt})
         if row is None:
             self._conn.execute(
                 "INSERT INTO messages (conversation_id, message_json) VALUES (?, ?)",
-                (conversation_id, json.dumps({"role": "system", "content": system_prompt})),
+                (conversation_id, expected),
             )
             self._conn.commit()
             return
 
-        first = json.loads(row["message_json"])
-        if first.get("role") == "system" and first.get("content") != system_prompt:
-            first["content"] = system_prompt
+        # The prompt is rebuilt on every message but rarely changes; comparing
+        # the stored text avoids decoding the whole prompt just to find that out.
+        if row["message_json"] == expected:
+            return
+        first = _loads(row["message_json"])
+        if first.get("role") != "system":
+            return
+        first["content"] = system_prompt
+        # A plain system message re-encodes to ``expected`` anyway, so write
+        # the encoding already used for the comparison instead of a second one.
+        payload = expected if first.keys() == _SYSTEM_MESSAGE_KEYS else _dumps(first)
+        # Also rewrites rows stored with older JSON spacing, so the text
+        # comparison above hits for them from the next message on.
+        if payload != row["message_json"]:
             self._conn.execute(
                 "UPDATE messages SET message_json = ? WHERE id = ?",
-                (json.dumps(first), row["id"]),
+                (payload, row["id"]),
             )
             self._conn.commit()
 
     # ── Messages ─────────────────────────────────────────────────
 
     def load_messages(self, conversation_id: str) -> list[dict[str, Any]]:
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             "SELECT id, message_json, created_at FROM messages WHERE conversation_id = ? ORDER BY id ASC",
             (conversation_id,),
-        ).fetchall()
+        )
+        # Parse rows as they stream off the cursor rather than holding every
+        # raw JSON string alongside its decoded dict; only the ids are kept.
+        ids: list[int] = []
         messages = []
-        for row in rows:
-            message = json.loads(row["message_json"])
+        for row in cursor:
+            message = _loads(row["message_json"])
             if row["created_at"]:
                 message[MESSAGE_CREATED_AT_KEY] = row["created_at"]
+            ids.append(row["id"])
             messages.append(message)
         safe_messages = trim_incomplete_tool_turns(messages)
 
         if len(safe_messages) != len(messages):
             removed = len(messages) - len(safe_messages)
-            cutoff_id = rows[len(safe_messages)]["id"]
+            cutoff_id = ids[len(safe_messages)]
             self._conn.execute(
                 "DELETE FROM messages WHERE conversation_id = ? AND id >= ?",
                 (conversation_id, cutoff_id),
@@ -445,6 +469,21 @@ class Store:
 
         return safe_messages
 
+    def load_text_turns(self, conversation_id: str) -> list[tuple[str, str]]:
+        """Return (role, content) for user/assistant messages with plain-text content.
+
+        SQLite pulls the two fields out in place, so tool results and
+        multimodal payloads are never decoded into Python objects.
+        """
+        rows = self._conn.execute(
+            "SELECT json_extract(message_json, '$.role'), json_extract(message_json, '$.content') "
+            "FROM messages WHERE conversation_id = ? "
+            "AND json_extract(message_json, '$.role') IN ('user', 'assistant') "
+            "AND json_type(message_json, '$.content') = 'text' ORDER BY id ASC",
+            (conversation_id,),
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
     def append_messages(self, conversation_id: str, messages: list[dict[str, Any]]) -> None:
         if not messages:
             return
@@ -455,7 +494,7 @@ class Store:
             rows.append(
                 (
                     conversation_id,
-                    json.dumps(payload),
+                    _dumps(payload),
                     created_at if isinstance(created_at, str) else None,
                 )
             )
@@ -484,6 +523,24 @@ class Store:
         )
         self._conn.commit()
 
+    def index_platform_messages(
+        self,
+        transport_name: str,
+        platform_message_ids: list[str],
+        conversation_id: str,
+    ) -> None:
+        """Index several platform message IDs under one commit."""
+        self._conn.executemany(
+            """
+            INSERT INTO platform_message_index (transport_name, platform_message_id, conversation_id)
+            VALUES (?, ?, ?)
+            ON CONFLICT(transport_name, platform_message_id) DO UPDATE SET
+                conversation_id=excluded.conversation_id
+            """,
+            [(transport_name, mid, conversation_id) for mid in platform_message_ids],
+        )
+        self._conn.commit()
+
     def lookup_platform_message(self, transport_name: str, platform_message_id: str) -> str | None:
         row = self._conn.execute(
             "SELECT conversation_id FROM platform_message_index WHERE transport_name = ? AND platform_message_id = ?",
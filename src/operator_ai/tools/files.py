@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from pathlib import Path
 
-from operator_ai.tools.registry import MAX_OUTPUT, tool
+from operator_ai.tools.registry import MAX_OUTPUT, OUTPUT_BYTE_CAP, tool
 from operator_ai.tools.workspace import get_workspace, is_sandboxed
 
-MAX_READ_BYTES = 1_000_000  # 1 MB
-
 
 def _resolve(path: str) -> Path:
     """Resolve a path relative to the agent workspace.
@@ -41,21 +40,21 @@ async def read_file(path: str) -> str:
         return f"[error: {e}]"
 
     def _read_sync() -> str:
-        if not p.exists():
-            return f"[error: file not found: {path}]"
         try:
-            size = p.stat().st_size
             with p.open("rb") as f:
-                data = f.read(MAX_READ_BYTES)
+                size = os.fstat(f.fileno()).st_size
+                # Only MAX_OUTPUT chars are ever returned, so read just the
+                # bytes that can decode into them rather than the whole file.
+                data = f.read(OUTPUT_BYTE_CAP)
             text = data.decode(errors="replace")
             if len(text) > MAX_OUTPUT:
                 text = (
                     text[:MAX_OUTPUT]
                     + f"\n[truncated — output exceeded 16KB, file is {size} bytes]"
                 )
-            elif size > MAX_READ_BYTES:
-                text += f"\n[truncated at {MAX_READ_BYTES} bytes, file is {size} bytes]"
             return text
+        except FileNotFoundError:
+            return f"[error: file not found: {path}]"
         except Exception as e:
             return f"[error reading file: {e}]"
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import shutil
 import stat
+from collections.abc import Callable
 from pathlib import Path
 
 from croniter import croniter
@@ -39,24 +40,13 @@ async def manage_job(action: str, name: str = "", config: str = "") -> str:
         config: Full JOB.md content for create/update. YAML frontmatter (between --- delimiters) with fields: name, description, schedule (cron, required), agent (optional — agent name to run as), model (optional, litellm format), enabled, hooks (prerun/postrun scripts). Body is the prompt — include posting instructions (channels, threading) since the agent uses send_message to deliver output.
     """
     action = action.lower().strip()
-
-    if action == "list":
-        return _list_jobs()
-    elif action == "create":
-        return _create_job(name, config)
-    elif action == "update":
-        return _update_job(name, config)
-    elif action == "delete":
-        return _delete_job(name)
-    elif action == "enable":
-        return _toggle_job(name, enabled=True)
-    elif action == "disable":
-        return _toggle_job(name, enabled=False)
-    else:
+    handler = _JOB_ACTIONS.get(action)
+    if handler is None:
         return (
             f"[error: unknown action '{action}'. "
             "Use: list, create, update, delete, enable, disable]"
         )
+    return handler(name, config)
 
 
 def _list_jobs() -> str:
@@ -220,3 +210,14 @@ def _toggle_job(name: str, *, enabled: bool) -> str:
 
     action = "Enabled" if enabled else "Disabled"
     return f"{action} job '{name}'"
+
+
+# action -> handler(name, config); one lookup instead of an if/elif chain.
+_JOB_ACTIONS: dict[str, Callable[[str, str], str]] = {
+    "list": lambda _name, _config: _list_jobs(),
+    "create": _create_job,
+    "update": _update_job,
+    "delete": lambda name, _config: _delete_job(name),
+    "enable": lambda name, _config: _toggle_job(name, enabled=True),
+    "disable": lambda name, _config: _toggle_job(name, enabled=False),
+}
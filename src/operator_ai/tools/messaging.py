@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 from typing import Any
 
@@ -77,7 +78,7 @@ async def send_file(path: str, channel: str = "", thread_id: str = "") -> str:
         size = file_path.stat().st_size
         if size > max_upload:
             return f"[error: file too large ({size} bytes, limit {max_upload})]"
-        file_data = file_path.read_bytes()
+        file_data = await asyncio.to_thread(file_path.read_bytes)
         message_id = await transport.send_file(channel_id, file_data, file_path.name, thread_id=tid)
         return message_id
     except NotImplementedError:
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import re
 from collections.abc import Callable
 from typing import Any, get_type_hints
 
+from operator_ai.utils import byte_cap, read_capped
+
 _TOOLS: list[ToolDef] = []
 
 MAX_OUTPUT = 16_384  # 16 KB — keeps tool results within ~4K tokens
+OUTPUT_BYTE_CAP = byte_cap(MAX_OUTPUT)
 
 
 def safe_name(name: str, entity: str) -> str:
@@ -17,23 +21,40 @@ def safe_name(name: str, entity: str) -> str:
     return name
 
 
+async def collect_process_output(proc: asyncio.subprocess.Process) -> tuple[bytes, bytes]:
+    """Read stdout and stderr concurrently until the process exits.
+
+    Unlike ``communicate()``, output past what format_process_output can show
+    is discarded as it arrives instead of being buffered in full.
+    """
+    stdout, stderr = await asyncio.gather(
+        read_capped(proc.stdout, OUTPUT_BYTE_CAP), read_capped(proc.stderr, OUTPUT_BYTE_CAP)
+    )
+    await proc.wait()
+    return stdout, stderr
+
+
 def format_process_output(
     stdout: bytes, stderr: bytes, returncode: int, max_output: int = MAX_OUTPUT
 ) -> str:
     """Assemble stdout/stderr/exit-code into a single truncated string."""
-    out = stdout.decode(errors="replace")
-    err = stderr.decode(errors="replace")
+    cap = byte_cap(max_output)
+    out = stdout[:cap].decode(errors="replace")
+    err = stderr[:cap].decode(errors="replace")
     parts: list[str] = []
     if out:
         parts.append(out)
     if err:
         parts.append(f"[stderr]\n{err}")
-    if returncode != 0:
-        parts.append(f"[exit code: {returncode}]")
-    result = "\n".join(parts) or "[no output]"
-    if len(result) > max_output:
-        result = result[:max_output] + "\n[truncated — output exceeded 16KB]"
-    return result
+    # The exit code is budgeted up front so truncation can never cut it off.
+    trailer = f"\n[exit code: {returncode}]" if returncode != 0 else ""
+    budget = max_output - len(trailer)
+    result = "\n".join(parts)
+    if len(result) > budget:
+        result = result[:budget] + "\n[truncated — output exceeded 16KB]"
+    if not result:
+        return trailer.lstrip("\n") or "[no output]"
+    return result + trailer
 
 
 class ToolDef:
@@ -42,16 +63,20 @@ class ToolDef:
         self.name = func.__name__
         self.description = description
         self.parameters = _build_parameters(func)
+        self._openai_tool: dict[str, Any] | None = None
 
     def to_openai_tool(self) -> dict[str, Any]:
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        # Built once per tool; every agent run and iteration reuses it.
+        if self._openai_tool is None:
+            self._openai_tool = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return self._openai_tool
 
 
 def tool(description: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 
-from operator_ai.tools.registry import format_process_output, tool
+from operator_ai.tools.registry import collect_process_output, format_process_output, tool
 from operator_ai.tools.workspace import get_workspace
 
 
@@ -27,7 +27,7 @@ async def run_shell(command: str, timeout: int = 120) -> str:
             stderr=asyncio.subprocess.PIPE,
             cwd=get_workspace(),
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        stdout, stderr = await asyncio.wait_for(collect_process_output(proc), timeout=timeout)
     except asyncio.CancelledError:
         # !stop should terminate in-flight shell commands immediately.
         if proc is not None:
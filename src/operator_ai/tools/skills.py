@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+from collections.abc import Callable
 
 from operator_ai.config import SKILLS_DIR
 from operator_ai.skills import (
@@ -25,17 +26,10 @@ async def manage_skill(action: str, name: str = "", config: str = "") -> str:
         config: Full SKILL.md content for create/update. YAML frontmatter (between --- delimiters) with required fields: name, description. Optional: license, compatibility, metadata (with metadata.env for required env vars). Body is the skill instructions in markdown.
     """
     action = action.lower().strip()
-
-    if action == "list":
-        return _list_skills()
-    elif action == "create":
-        return _create_skill(name, config)
-    elif action == "update":
-        return _update_skill(name, config)
-    elif action == "delete":
-        return _delete_skill(name)
-    else:
+    handler = _SKILL_ACTIONS.get(action)
+    if handler is None:
         return f"[error: unknown action '{action}'. Use: list, create, update, delete]"
+    return handler(name, config)
 
 
 def _list_skills() -> str:
@@ -135,3 +129,12 @@ def _delete_skill(name: str) -> str:
 
     shutil.rmtree(skill_dir)
     return f"Deleted skill '{name}'"
+
+
+# action -> handler(name, config); one lookup instead of an if/elif chain.
+_SKILL_ACTIONS: dict[str, Callable[[str, str], str]] = {
+    "list": lambda _name, _config: _list_skills(),
+    "create": _create_skill,
+    "update": _update_skill,
+    "delete": lambda name, _config: _delete_skill(name),
+}
@@ -5,10 +5,18 @@ import logging
 import os
 import re
 import shlex
+from pathlib import Path
 
 from operator_ai.config import SKILLS_DIR, ConfigError, load_config
 from operator_ai.tools.context import get_skill_filter
-from operator_ai.tools.registry import MAX_OUTPUT, format_process_output, safe_name, tool
+from operator_ai.tools.registry import (
+    MAX_OUTPUT,
+    OUTPUT_BYTE_CAP,
+    collect_process_output,
+    format_process_output,
+    safe_name,
+    tool,
+)
 from operator_ai.tools.workspace import get_workspace
 
 logger = logging.getLogger("operator.tools.skills_access")
@@ -27,6 +35,42 @@ def _expand_env_refs(value: str, env: dict[str, str]) -> str:
     return _ENV_REF_RE.sub(replace, value)
 
 
+def _transport_token_envs() -> set[str]:
+    """Env var names holding transport credentials for any configured agent."""
+    try:
+        config = load_config()
+    except ConfigError:
+        # Config might not be loadable in test environments
+        return set()
+    keys: set[str] = set()
+    for agent_cfg in config.agents.values():
+        tc = agent_cfg.transport
+        if tc is None:
+            continue
+        if tc.bot_token_env:
+            keys.add(tc.bot_token_env)
+        if tc.app_token_env:
+            keys.add(tc.app_token_env)
+    return keys
+
+
+def _skill_env(skill_dir: Path) -> dict[str, str]:
+    """Sanitized copy of os.environ for skill subprocesses, built in one pass.
+
+    os.environ already has the correct PATH from .env loading. Transport
+    tokens and OPERATOR_* vars (other than the allowlist) are dropped.
+    """
+    strip_keys = _transport_token_envs()
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in strip_keys
+        and (not key.startswith("OPERATOR_") or key in _ALLOWED_OPERATOR_ENV)
+    }
+    env["SKILL_DIR"] = str(skill_dir)
+    return env
+
+
 def _check_skill_access(skill: str) -> str | None:
     """Check if skill is accessible. Returns error string or None."""
     try:
@@ -72,11 +116,17 @@ async def read_skill(skill: str, path: str = "") -> str:
             return "[error: path traversal not allowed]"
         target = skill_dir / path
 
+    return await asyncio.to_thread(_read_skill_file, target)
+
+
+def _read_skill_file(target: Path) -> str:
     if not target.is_file():
         return f"[error: file not found: {target}]"
 
     try:
-        content = target.read_text()
+        with target.open("rb") as f:
+            data = f.read(OUTPUT_BYTE_CAP)
+        content = data.decode(errors="replace")
     except Exception as e:
         return f"[error reading file: {e}]"
 
@@ -116,32 +166,7 @@ async def run_skill(skill: str, command: str, timeout: int = 120) -> str:
     if not argv:
         return "[error: empty command]"
 
-    # Build env — os.environ already has the correct PATH from .env loading
-    env = os.environ.copy()
-    env["SKILL_DIR"] = str(skill_dir)
-
-    # Strip transport-config env vars
-    try:
-        config = load_config()
-        strip_keys: set[str] = set()
-        for agent_cfg in config.agents.values():
-            tc = agent_cfg.transport
-            if tc is None:
-                continue
-            if tc.bot_token_env:
-                strip_keys.add(tc.bot_token_env)
-            if tc.app_token_env:
-                strip_keys.add(tc.app_token_env)
-        for key in strip_keys:
-            env.pop(key, None)
-    except ConfigError:
-        # Config might not be loadable in test environments
-        pass
-
-    # Strip any OPERATOR_* vars
-    for key in list(env.keys()):
-        if key.startswith("OPERATOR_") and key not in _ALLOWED_OPERATOR_ENV:
-            del env[key]
+    env = _skill_env(skill_dir)
 
     # Expand env references after sanitization so stripped vars stay unavailable.
     argv = [_expand_env_refs(arg, env) for arg in argv]
@@ -163,7 +188,7 @@ async def run_skill(skill: str, command: str, timeout: int = 120) -> str:
             cwd=get_workspace(),
             env=env,
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        stdout, stderr = await asyncio.wait_for(collect_process_output(proc), timeout=timeout)
     except asyncio.CancelledError:
         if proc is not None:
             proc.kill()
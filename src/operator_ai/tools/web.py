@@ -4,7 +4,7 @@ import asyncio
 import logging
 from collections import OrderedDict
 from html.parser import HTMLParser
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 import aiohttp
 import trafilatura
@@ -49,19 +49,16 @@ def _is_html(content_type: str | None) -> bool:
     return bool(content_type and "html" in content_type)
 
 
-def _is_already_markdown(url: str) -> bool:
-    path = urlparse(url).path.lower()
-    return path.endswith(".md") or path.endswith(".txt")
+def _is_already_markdown(parsed: ParseResult) -> bool:
+    return parsed.path.lower().endswith((".md", ".txt"))
 
 
-def _domain(url: str) -> str:
-    parsed = urlparse(url)
+def _domain(parsed: ParseResult) -> str:
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-async def _try_md_variant(session: aiohttp.ClientSession, url: str) -> str | None:
+async def _try_md_variant(session: aiohttp.ClientSession, parsed: ParseResult) -> str | None:
     """Try fetching the .md version of a URL per the llms.txt spec."""
-    parsed = urlparse(url)
     md_path = parsed.path.rstrip("/") + ".md"
     md_url = parsed._replace(path=md_path).geturl()
     try:
@@ -76,9 +73,8 @@ async def _try_md_variant(session: aiohttp.ClientSession, url: str) -> str | Non
     return None
 
 
-async def _check_llms_txt(session: aiohttp.ClientSession, url: str) -> bool:
+async def _check_llms_txt(session: aiohttp.ClientSession, domain: str) -> bool:
     """Check if the domain serves /llms.txt (cached per domain)."""
-    domain = _domain(url)
     if domain in _llms_txt_cache:
         _llms_txt_cache.move_to_end(domain)
         return _llms_txt_cache[domain]
@@ -166,18 +162,20 @@ async def web_fetch(url: str, offset: int = 0, limit: int = DEFAULT_LIMIT) -> st
     offset = max(offset, 0)
 
     try:
+        # Parse once; the .md probe, llms.txt check and footer all derive from it.
+        parsed = urlparse(url)
+        domain = _domain(parsed)
+        already_markdown = _is_already_markdown(parsed)
         session = await get_session()
 
         # For non-markdown URLs, try the .md variant first
-        if not _is_already_markdown(url):
-            md_content = await _try_md_variant(session, url)
+        if not already_markdown:
+            md_content = await _try_md_variant(session, parsed)
             if md_content:
-                has_llms = await _check_llms_txt(session, url)
+                has_llms = await _check_llms_txt(session, domain)
                 result = _chunk(md_content, offset, limit)
                 if has_llms and offset == 0:
-                    result += (
-                        f"\n\n[This site has an LLM-friendly index at {_domain(url)}/llms.txt]"
-                    )
+                    result += f"\n\n[This site has an LLM-friendly index at {domain}/llms.txt]"
                 return result
 
         # Fetch the original URL
@@ -193,7 +191,7 @@ async def web_fetch(url: str, offset: int = 0, limit: int = DEFAULT_LIMIT) -> st
             raw = await resp.text()
 
         # Determine extraction strategy
-        if _is_html(content_type) and not _is_already_markdown(url):
+        if _is_html(content_type) and not already_markdown:
             # HTML — extract clean content
             text = await _extract_with_trafilatura(raw)
             if not text:
@@ -204,12 +202,11 @@ async def web_fetch(url: str, offset: int = 0, limit: int = DEFAULT_LIMIT) -> st
             text = raw
 
         # Check for llms.txt (populates cache for this domain)
-        has_llms = await _check_llms_txt(session, url)
+        has_llms = await _check_llms_txt(session, domain)
 
         result = _chunk(text, offset, limit)
 
         if has_llms and offset == 0:
-            domain = _domain(url)
             result += f"\n\n[This site has an LLM-friendly index at {domain}/llms.txt]"
 
         return result
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import io
 import logging
 import re
 from collections.abc import Awaitable, Callable
@@ -25,13 +26,43 @@ _mrkdwn = SlackMarkdownConverter()
 CACHE_REFRESH_SECONDS = 15 * 60  # 15 minutes
 MAX_API_ATTEMPTS = 3
 BASE_RETRY_SECONDS = 1.0
+# File downloads: no overall cap (a 50 MB file on a slow link is fine while it
+# keeps moving), but bail on a slow connect or a read that stalls.
+_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=20, sock_read=60)
+
+
+# Edited/deleted/system message variants are ignored; file_share (a message
+# with uploaded files) is the one subtype handled alongside plain messages.
+# An empty-string subtype counts as none (``or None`` at the call sites).
+_DISPATCH_SUBTYPES = frozenset({None, "file_share"})
+
+
+def _accepts_mention(event: dict) -> bool:
+    # Skip DMs — the message handler already covers them. Without this
+    # guard, a DM @mention fires both events and can cause duplicate
+    # processing.
+    return (
+        event.get("channel_type") != "im" and (event.get("subtype") or None) in _DISPATCH_SUBTYPES
+    )
+
+
+def _accepts_dm(event: dict) -> bool:
+    # Only handle DMs (im channels) — app_mention covers channels.
+    return (
+        event.get("channel_type") == "im"
+        and not event.get("bot_id")
+        and (event.get("subtype") or None) in _DISPATCH_SUBTYPES
+    )
 
 
 def _extract_attachments(event: dict) -> list[Attachment]:
     """Extract file attachments from a Slack event."""
     attachments: list[Attachment] = []
     for f in event.get("files", []):
-        url = f.get("url_private", "")
+        # Always take the original upload: url_private_download is the
+        # full-resolution file, url_private the fallback for older payloads.
+        # Thumbnails (thumb_*) are never used.
+        url = f.get("url_private_download") or f.get("url_private", "")
         if not url:
             continue
         attachments.append(
@@ -71,6 +102,7 @@ class SlackTransport(Transport):
         self._app: AsyncApp | None = None
         self._handler: AsyncSocketModeHandler | None = None
         self._background_tasks: set[asyncio.Task] = set()
+        self._http: aiohttp.ClientSession | None = None
 
         # In-memory caches (populated by _refresh_cache)
         self._users: dict[str, str] = {}  # user_id -> display name
@@ -78,6 +110,7 @@ class SlackTransport(Transport):
         self._channel_ids: dict[str, str] = {}  # name (no #) -> channel_id
         self._channel_info: dict[str, str] = {}  # channel_id -> topic/purpose snippet
         self._refresh_task: asyncio.Task | None = None
+        self._tools: list[ToolDef] | None = None
 
     @override
     async def start(self, on_message: Callable[[IncomingMessage], Awaitable[None]]) -> None:
@@ -85,17 +118,12 @@ class SlackTransport(Transport):
 
         @self._app.event("app_mention")
         async def handle_mention(event: dict, say):  # noqa: ARG001
-            # Skip DMs — the message handler below already covers them.
-            # Without this guard, a DM @mention fires both events and
-            # can cause duplicate processing.
-            if event.get("channel_type") == "im":
-                return
-            self._create_task(self._dispatch(event, on_message))
+            if _accepts_mention(event):
+                self._create_task(self._dispatch(event, on_message))
 
         @self._app.event("message")
         async def handle_message(event: dict, say):  # noqa: ARG001
-            # Only handle DMs (im channels) — app_mention covers channels
-            if event.get("channel_type") == "im" and not event.get("bot_id"):
+            if _accepts_dm(event):
                 self._create_task(self._dispatch(event, on_message))
 
         self._handler = AsyncSocketModeHandler(self._app, self._app_token)
@@ -119,12 +147,32 @@ class SlackTransport(Transport):
             await self._handler.close_async()
             logger.info("Stopped Slack transport '%s'", self.name)
             self._handler = None
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
         self._app = None
 
     def _create_task(self, coro: Awaitable[None]) -> None:
         task = asyncio.create_task(coro)
         self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._background_tasks.discard(task)
+        # Nothing else awaits these tasks; surface failures now rather than as a
+        # "Task exception was never retrieved" warning whenever GC gets to them.
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Slack event handler failed", exc_info=exc)
+
+    def _get_http(self) -> aiohttp.ClientSession:
+        # One keep-alive session per transport so file downloads reuse the
+        # pooled TLS connection to files.slack.com instead of reconnecting.
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {self._bot_token}"},
+                timeout=_DOWNLOAD_TIMEOUT,
+            )
+        return self._http
 
     def _require_app(self) -> AsyncApp:
         if self._app is None:
@@ -273,27 +321,26 @@ class SlackTransport(Transport):
 
     @override
     async def download_file(self, attachment: Attachment) -> bytes:
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self._bot_token}"}
-            async with session.get(attachment.url, headers=headers) as resp:
-                resp.raise_for_status()
-                length = resp.content_length
-                if length is not None and length > self._MAX_DOWNLOAD:
-                    raise ValueError(f"File too large: {length} bytes (limit {self._MAX_DOWNLOAD})")
-                if length is not None:
-                    # Content-Length known and within limits — safe to read at once
-                    return await resp.read()
-                # Unknown size — read incrementally with a cap
-                chunks: list[bytes] = []
-                total = 0
-                async for chunk in resp.content.iter_chunked(1024 * 1024):
-                    total += len(chunk)
-                    if total > self._MAX_DOWNLOAD:
-                        raise ValueError(
-                            f"File too large: >{self._MAX_DOWNLOAD} bytes (limit {self._MAX_DOWNLOAD})"
-                        )
-                    chunks.append(chunk)
-                return b"".join(chunks)
+        session = self._get_http()
+        async with session.get(attachment.url) as resp:
+            resp.raise_for_status()
+            length = resp.content_length
+            if length is not None and length > self._MAX_DOWNLOAD:
+                raise ValueError(f"File too large: {length} bytes (limit {self._MAX_DOWNLOAD})")
+            if length is not None:
+                # Content-Length known and within limits — safe to read at once
+                return await resp.read()
+            # Unknown size — read incrementally with a cap. BytesIO grows in
+            # place and getvalue() hands back its buffer, so a large file is
+            # not held twice the way a chunk list plus b"".join would be.
+            buf = io.BytesIO()
+            async for chunk in resp.content.iter_chunked(1024 * 1024):
+                buf.write(chunk)
+                if buf.tell() > self._MAX_DOWNLOAD:
+                    raise ValueError(
+                        f"File too large: >{self._MAX_DOWNLOAD} bytes (limit {self._MAX_DOWNLOAD})"
+                    )
+            return buf.getvalue()
 
     @override
     async def send_file(
@@ -410,6 +457,13 @@ class SlackTransport(Transport):
 
     @override
     def get_tools(self) -> list[ToolDef]:
+        # ToolDef introspects signatures and docstrings, so build the
+        # transport tools once instead of on every conversation turn.
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return list(self._tools)
+
+    def _build_tools(self) -> list[ToolDef]:
         async def list_channels() -> str:
             """List available Slack channels the bot can post to."""
             if not self._channels:
@@ -559,11 +613,6 @@ class SlackTransport(Transport):
         event: dict,
         on_message: Callable[[IncomingMessage], Awaitable[None]],
     ) -> None:
-        subtype = event.get("subtype")
-        if subtype and subtype != "file_share":
-            # Ignore edited/deleted/system message variants,
-            # but allow file_share (message with uploaded files).
-            return
         text = event.get("text", "")
         text = MENTION_RE.sub("", text).strip()
 
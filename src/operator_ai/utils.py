@@ -1,5 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from pathlib import Path
+
+# Larger than everything a subprocess StreamReader buffers before pausing the
+# pipe (2 x its 64KB limit), so each wakeup drains a whole burst in one read.
+PIPE_READ_SIZE = 256 * 1024
+
+
+def byte_cap(max_chars: int) -> int:
+    """Bytes to keep so decoding them still yields more than ``max_chars`` chars.
+
+    A UTF-8 char never spans more than 4 bytes, so anything past this prefix
+    would be truncated anyway.
+    """
+    return (max_chars + 1) * 4
+
+
+def subdir_names(path: Path) -> list[str]:
+    """Sorted names of the directories directly under ``path`` ([] if it is missing).
+
+    One scandir pass answers "is it a directory" from the dirent type, so no
+    per-entry stat calls are made.
+    """
+    try:
+        with os.scandir(path) as it:
+            return sorted(entry.name for entry in it if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
 
 def truncate(s: str, max_len: int) -> str:
     return s[:max_len] + "..." if len(s) > max_len else s
+
+
+async def read_capped(stream: asyncio.StreamReader | None, cap: int) -> bytes:
+    """Drain a pipe to EOF in large binary reads, keeping only the first ``cap`` bytes."""
+    if stream is None:
+        return b""
+    buf = bytearray()
+    while chunk := await stream.read(PIPE_READ_SIZE):
+        if len(buf) < cap:
+            buf += chunk[: cap - len(buf)]
+    return bytes(buf)
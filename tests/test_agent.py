@@ -332,3 +332,11 @@ def test_run_agent_fallback_omits_reasoning_effort_and_sanitizes_history(
     assert "provider_specific_fields" not in second_assistant
     assert "history for anthropic/claude-sonnet-4-6 dropped" in caplog.text
     assert "requested thinking=high but reasoning control unsupported" in caplog.text
+
+
+def test_parse_tool_args_only_accepts_objects() -> None:
+    assert agent_module._parse_tool_args("") == {}
+    assert agent_module._parse_tool_args(' {"path": "a.txt"}') == {"path": "a.txt"}
+    assert agent_module._parse_tool_args("[1, 2]") is None
+    assert agent_module._parse_tool_args("not json") is None
+    assert agent_module._parse_tool_args("{broken") is None
@@ -39,3 +39,10 @@ def test_multiple_roles_union_agents() -> None:
     }
     result = resolve_allowed_agents(roles, config_roles)
     assert result == {"agent-a", "agent-b", "agent-c"}
+
+
+def test_single_role_reuses_frozen_agent_set() -> None:
+    viewer = RoleConfig(agents=["agent-a"])
+    result = resolve_allowed_agents(["viewer"], {"viewer": viewer})
+    assert result is viewer.agent_set
+    assert isinstance(result, frozenset)
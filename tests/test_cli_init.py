@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock, patch
 
 from typer.testing import CliRunner
 
-from operator_ai.cli import _STARTER_CONFIG, _generate_plist, _generate_systemd_unit, app
+from operator_ai.cli import (
+    _STARTER_CONFIG,
+    _generate_plist,
+    _generate_systemd_unit,
+    _update_env_file,
+    app,
+)
 from operator_ai.store import Store
 
 runner = CliRunner()
@@ -96,6 +102,26 @@ def test_generate_systemd_unit_embeds_path():
     assert "/usr" in unit or "/bin" in unit
 
 
+def test_generate_systemd_unit_dedupes_path_in_order(monkeypatch):
+    monkeypatch.setenv("PATH", "/home/u/.local/bin:/usr/bin:/bin:/usr/bin:/home/u/.local/bin")
+    unit = _generate_systemd_unit("/usr/local/bin/operator")
+    assert "Environment=PATH=/home/u/.local/bin:/usr/bin:/bin\n" in unit
+
+
+def test_update_env_file_replaces_values_and_skips_noop_writes(tmp_path: Path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("# keys\nSLACK_BOT_TOKEN=old\n")
+
+    _update_env_file(env_file, {"SLACK_BOT_TOKEN": "new", "OPENAI_API_KEY": "sk"})
+    assert env_file.read_text() == "# keys\nSLACK_BOT_TOKEN=new\n\nOPENAI_API_KEY=sk\n"
+    assert env_file.stat().st_mode & 0o777 == 0o600
+    assert not (tmp_path / ".env.tmp").exists()
+
+    mtime = env_file.stat().st_mtime_ns
+    _update_env_file(env_file, {"SLACK_BOT_TOKEN": "new"})
+    assert env_file.stat().st_mtime_ns == mtime
+
+
 def test_init_skips_existing_env_file(tmp_path: Path):
     op_dir = tmp_path / ".operator"
     op_dir.mkdir()
@@ -161,7 +187,7 @@ def test_setup_run_invokes_runtime(tmp_path: Path):
         patch("operator_ai.cli.OPERATOR_DIR", op_dir),
         patch("operator_ai.cli._store", return_value=store),
         patch("operator_ai.skills.install_bundled_skills", return_value=[]),
-        patch("operator_ai.cli.async_main", async_main),
+        patch("operator_ai.main.async_main", async_main),
     ):
         result = runner.invoke(
             app,
@@ -4,6 +4,7 @@ import os
 from zoneinfo import ZoneInfo
 
 import pytest
+import yaml
 
 from operator_ai.config import (
     Config,
@@ -112,6 +113,12 @@ def test_skill_list_filter() -> None:
     assert f("other") is False
 
 
+def test_permission_filters_are_built_once_per_config() -> None:
+    c = _cfg(permissions={"tools": ["read_file"], "skills": ["deploy"]})
+    assert c.agent_tool_filter("a") is c.agent_tool_filter("a")
+    assert c.agent_skill_filter("a") is c.agent_skill_filter("a")
+
+
 def test_unknown_agent_returns_none_filter() -> None:
     c = _cfg(permissions={"tools": ["run_shell"]})
     assert c.agent_tool_filter("nonexistent") is None
@@ -289,3 +296,43 @@ def test_load_config_reads_runtime_env_file(tmp_path, monkeypatch) -> None:
     load_config(config_path)
 
     assert os.environ["OPERATOR_RUNTIME_ENV_TEST"] == "loaded"
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "operator.yaml"
+    config_path.write_text('defaults:\n  models:\n    - "test/model"\n')
+
+    parses: list[object] = []
+    real_safe_load = yaml.safe_load
+
+    def _safe_load(stream):
+        parses.append(stream)
+        return real_safe_load(stream)
+
+    monkeypatch.setattr(yaml, "safe_load", _safe_load)
+
+    first = load_config(config_path)
+    assert load_config(config_path) is first
+    assert len(parses) == 1
+
+    config_path.write_text('defaults:\n  models:\n    - "test/other-model"\n')
+    reloaded = load_config(config_path)
+    assert len(parses) == 2
+    assert reloaded.defaults.models == ["test/other-model"]
+
+
+def test_load_config_rereads_env_file_on_cache_hit(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("OPERATOR_LATE_ENV_TEST", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("# empty\n")
+    config_path = tmp_path / "operator.yaml"
+    config_path.write_text(
+        'runtime:\n  env_file: ".env"\ndefaults:\n  models:\n    - "test/model"\n'
+    )
+
+    load_config(config_path)
+    assert "OPERATOR_LATE_ENV_TEST" not in os.environ
+
+    env_file.write_text("OPERATOR_LATE_ENV_TEST=added\n")
+    load_config(config_path)
+    assert os.environ["OPERATOR_LATE_ENV_TEST"] == "added"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -185,6 +186,69 @@ def test_process_attachments_duplicate_filename(tmp_path: Path):
     assert (uploads / "file_1.txt").exists()
 
 
+def test_process_attachments_downloads_concurrently_in_order(tmp_path: Path):
+    from operator_ai.main import MAX_DOWNLOAD_SIZE, process_attachments
+
+    in_flight = 0
+    peak = 0
+
+    async def _download(att: Attachment) -> bytes:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 if att.filename == "a.txt" else 0)
+        in_flight -= 1
+        if att.filename == "b.txt":
+            raise RuntimeError("network error")
+        return att.filename.encode()
+
+    transport = AsyncMock(spec=Transport)
+    transport.download_file = AsyncMock(side_effect=_download)
+    atts = [
+        Attachment("a.txt", "text/plain", 5, "http://x/a"),
+        Attachment("huge.bin", "application/octet-stream", MAX_DOWNLOAD_SIZE + 1, "http://x/h"),
+        Attachment("b.txt", "text/plain", 5, "http://x/b"),
+        Attachment("c.txt", "text/plain", 5, "http://x/c"),
+    ]
+    blocks = asyncio.run(process_attachments(atts, transport, tmp_path))
+
+    assert peak == 3
+    assert [b["text"].split(":")[0] for b in blocks] == [
+        "[file saved",
+        "[skipped",
+        "[failed to download",
+        "[file saved",
+    ]
+    assert "a.txt" in blocks[0]["text"]
+    assert "c.txt" in blocks[3]["text"]
+
+
+def test_process_attachments_caps_concurrent_downloads(tmp_path: Path):
+    from operator_ai.main import MAX_CONCURRENT_DOWNLOADS, process_attachments
+
+    in_flight = 0
+    peak = 0
+
+    async def _download(_att: Attachment) -> bytes:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return b"x"
+
+    transport = AsyncMock(spec=Transport)
+    transport.download_file = AsyncMock(side_effect=_download)
+    atts = [
+        Attachment(f"f{i}.png", "image/png", 1, f"http://x/{i}")
+        for i in range(MAX_CONCURRENT_DOWNLOADS * 3)
+    ]
+    blocks = asyncio.run(process_attachments(atts, transport, tmp_path))
+
+    assert peak == MAX_CONCURRENT_DOWNLOADS
+    assert len(blocks) == len(atts)
+
+
 def test_process_attachments_oversized_skipped(tmp_path: Path):
     from operator_ai.main import MAX_DOWNLOAD_SIZE, process_attachments
 
@@ -302,3 +366,66 @@ def test_send_file_tool_escapes_workspace(tmp_path: Path):
 
     result = asyncio.run(messaging.send_file("../../etc/passwd"))
     assert "escapes workspace" in result
+
+
+def test_merge_text_blocks_joins_adjacent_text_only():
+    from operator_ai.main import _merge_text_blocks
+
+    image = {"type": "image_url", "image_url": {"url": "data:image/png;base64,AA=="}}
+    blocks = [
+        {"type": "text", "text": "hello"},
+        {"type": "text", "text": "[file saved: uploads/a.pdf]"},
+        image,
+        {"type": "text", "text": "[skipped: b.zip too large]"},
+    ]
+
+    assert _merge_text_blocks(blocks) == [
+        {"type": "text", "text": "hello\n[file saved: uploads/a.pdf]"},
+        image,
+        {"type": "text", "text": "[skipped: b.zip too large]"},
+    ]
+
+
+def test_save_upload_concurrent_same_name_never_collides(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from operator_ai.main import _save_upload
+
+    uploads = tmp_path / "uploads"
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        dests = list(
+            pool.map(lambda i: _save_upload(uploads, "same.txt", str(i).encode()), range(16))
+        )
+
+    assert len({d.name for d in dests}) == 16
+    assert sorted(int(d.read_bytes()) for d in dests) == list(range(16))
+
+
+def test_save_upload_switches_to_random_tag_after_numbered_copies(tmp_path: Path):
+    from operator_ai.main import _MAX_UPLOAD_SUFFIX, _save_upload
+
+    uploads = tmp_path / "uploads"
+    names = [_save_upload(uploads, "image.png", b"x").name for _ in range(_MAX_UPLOAD_SUFFIX + 3)]
+
+    assert names[: _MAX_UPLOAD_SUFFIX + 1] == ["image.png"] + [
+        f"image_{i}.png" for i in range(1, _MAX_UPLOAD_SUFFIX + 1)
+    ]
+    for name in names[_MAX_UPLOAD_SUFFIX + 1 :]:
+        assert re.fullmatch(r"image_[0-9a-f]{8}\.png", name)
+
+
+def test_save_upload_removes_reserved_name_when_write_fails(monkeypatch, tmp_path: Path):
+    from operator_ai.main import _save_upload
+
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+
+    def _fail(self: Path, _data: bytes) -> int:
+        self.write_text("partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "write_bytes", _fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        _save_upload(uploads, "report.pdf", b"data")
+    assert list(uploads.iterdir()) == []
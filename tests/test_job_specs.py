@@ -86,3 +86,35 @@ Body
     spec = find_job_spec("release-audit", jobs_dir)
     assert spec is not None
     assert spec.name == "release-audit"
+
+
+def test_find_job_spec_reads_matching_directory_without_full_scan(
+    monkeypatch, tmp_path: Path
+) -> None:
+    jobs_dir = tmp_path / "jobs"
+    _write_job(jobs_dir / "nightly" / "JOB.md", "---\nname: nightly\nschedule: '0 0 * * *'\n---\n")
+
+    def _no_scan(_jobs_dir: Path) -> list:
+        raise AssertionError("full scan not expected")
+
+    monkeypatch.setattr("operator_ai.job_specs.scan_job_specs", _no_scan)
+
+    spec = find_job_spec("nightly", jobs_dir)
+    assert spec is not None
+    assert spec.schedule == "0 0 * * *"
+
+
+def test_find_job_spec_prefers_directory_named_after_duplicate_job(tmp_path: Path) -> None:
+    jobs_dir = tmp_path / "jobs"
+    _write_job(jobs_dir / "a-copy" / "JOB.md", "---\nname: nightly\nschedule: '0 1 * * *'\n---\n")
+    _write_job(jobs_dir / "b-copy" / "JOB.md", "---\nname: nightly\nschedule: '0 2 * * *'\n---\n")
+
+    # Without a directory named after the job, the first in directory order wins.
+    spec = find_job_spec("nightly", jobs_dir)
+    assert spec is not None
+    assert spec.schedule == "0 1 * * *"
+
+    _write_job(jobs_dir / "nightly" / "JOB.md", "---\nname: nightly\nschedule: '0 0 * * *'\n---\n")
+    spec = find_job_spec("nightly", jobs_dir)
+    assert spec is not None
+    assert spec.schedule == "0 0 * * *"
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from pathlib import Path
 
 from operator_ai.config import Config
-from operator_ai.jobs import Job, _build_job_prompt, _execute_job, _job_memory_scopes
+from operator_ai.jobs import (
+    MAX_HOOK_OUTPUT,
+    Job,
+    JobRunner,
+    _build_job_prompt,
+    _execute_job,
+    _job_memory_scopes,
+    _run_hook,
+    scan_jobs,
+)
 from operator_ai.message_timestamps import MESSAGE_CREATED_AT_KEY
 from operator_ai.store import JobState
 from operator_ai.tools import memory as memory_tools
@@ -135,3 +145,77 @@ def test_execute_job_configures_memory_and_skill_filter(monkeypatch, tmp_path: P
     )
 
     assert store.state.last_result == "success"
+
+
+def test_run_hook_passes_stdin_and_caps_output(caplog, tmp_path: Path) -> None:
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    echo = scripts / "echo.sh"
+    echo.write_text("#!/bin/sh\ncat\n")
+    echo.chmod(0o755)
+    flood = scripts / "flood.sh"
+    flood.write_text("#!/bin/sh\nhead -c 200000 /dev/zero | tr '\\0' x\n")
+    flood.chmod(0o755)
+    job = Job(
+        name="hooks",
+        description="",
+        schedule="* * * * *",
+        prompt="",
+        job_dir=tmp_path,
+        hooks={"postrun": "scripts/echo.sh", "prerun": "scripts/flood.sh"},
+    )
+
+    assert asyncio.run(_run_hook(job, "postrun", stdin_data="agent output")) == (0, "agent output")
+
+    with caplog.at_level(logging.INFO, logger="operator.jobs"):
+        code, output = asyncio.run(_run_hook(job, "prerun"))
+    assert code == 0
+    assert output == "x" * MAX_HOOK_OUTPUT + "\n[truncated — hook output exceeded 16KB]"
+    assert caplog.records[-1].getMessage().endswith(" — " + "x" * 200 + "…")
+
+
+def test_scan_jobs_reads_only_dirs_with_job_md(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("operator_ai.jobs.JOBS_DIR", tmp_path)
+    for name in ("b-job", "a-job"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "JOB.md").write_text(
+            f"---\nname: {name}\nschedule: '0 * * * *'\n---\n\nDo {name}.\n"
+        )
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "stray.md").write_text("not a job")
+
+    assert [job.name for job in scan_jobs()] == ["a-job", "b-job"]
+
+    monkeypatch.setattr("operator_ai.jobs.JOBS_DIR", tmp_path / "missing")
+    assert scan_jobs() == []
+
+
+def test_tick_scans_agents_once_for_all_due_jobs(monkeypatch, tmp_path: Path) -> None:
+    jobs = [
+        Job(name=name, description="", schedule="* * * * *", prompt="", job_dir=tmp_path)
+        for name in ("one", "two")
+    ]
+    roster = [object()]
+    scans: list[None] = []
+    fired: list[tuple[str, object]] = []
+
+    def _scan_agents() -> list[object]:
+        scans.append(None)
+        return roster
+
+    async def _fake_execute(job, *_args, available_agents=None) -> None:
+        fired.append((job.name, available_agents))
+
+    monkeypatch.setattr("operator_ai.jobs.scan_jobs", lambda: jobs)
+    monkeypatch.setattr("operator_ai.jobs.scan_agents", _scan_agents)
+    monkeypatch.setattr("operator_ai.jobs._execute_job", _fake_execute)
+
+    async def _run() -> None:
+        runner = JobRunner(_config(), {}, FakeStore())
+        await runner._tick()
+        await asyncio.gather(*runner._tasks)
+
+    asyncio.run(_run())
+
+    assert len(scans) == 1
+    assert fired == [("one", roster), ("two", roster)]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 import pytest
 
+from operator_ai.config import ScheduledTaskConfig
 from operator_ai.main import _conversation_memory_scopes
-from operator_ai.memory import _parse_harvested_memories
+from operator_ai.memory import ScheduledWorker, _join_tail, _parse_harvested_memories
 from operator_ai.tools import memory as memory_tools
 
 
@@ -222,3 +226,81 @@ def test_conversation_memory_scopes_public_channel() -> None:
         is_private=False,
     )
     assert scopes == [("agent", "hermy"), ("global", "global")]
+
+
+# -- harvester conversation tail ---------------------------------------------
+
+
+def test_join_tail_matches_full_join_slice() -> None:
+    parts = [f"user: message {i} " + "x" * (i % 7) for i in range(200)]
+    full = "\n".join(parts)
+
+    for limit in (1, 5, 40, 500, len(full) - 1, len(full), len(full) + 10):
+        assert _join_tail(parts, limit) == full[-limit:]
+
+
+def test_join_tail_empty() -> None:
+    assert _join_tail([], 100) == ""
+
+
+# -- scheduled worker loop ---------------------------------------------------
+
+
+class _RecordingWorker(ScheduledWorker):
+    def __init__(self, clock: list[float], tz: ZoneInfo) -> None:
+        super().__init__(None, None, ScheduledTaskConfig(schedule="0 3 * * *"), tz=tz)  # type: ignore[arg-type]
+        self.fired_at: list[datetime] = []
+        self._clock = clock
+
+    async def _tick(self) -> None:
+        self.fired_at.append(datetime.fromtimestamp(self._clock[0], self._tz))
+
+
+def _run_worker_over(
+    monkeypatch, start: datetime, tz: ZoneInfo
+) -> tuple[list[float], list[datetime]]:
+    clock = [start.timestamp()]
+    delays: list[float] = []
+
+    class _FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock[0], tz)
+
+    async def _fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) > 2:
+            raise asyncio.CancelledError
+        clock[0] += delay
+
+    monkeypatch.setattr("operator_ai.memory.datetime", _FakeDatetime)
+    monkeypatch.setattr("operator_ai.memory.time", SimpleNamespace(time=lambda: clock[0]))
+    monkeypatch.setattr("operator_ai.memory.asyncio.sleep", _fake_sleep)
+
+    worker = _RecordingWorker(clock, tz)
+    asyncio.run(worker._tick_loop())
+    return delays, worker.fired_at
+
+
+@pytest.mark.parametrize(
+    ("start", "first_delay_hours"),
+    [
+        # Fall back: 01:00-02:00 happens twice, so 03:00 is four real hours away.
+        (datetime(2025, 11, 2, 4, 0, tzinfo=UTC), 4),
+        # Spring forward: 02:00-03:00 is skipped, so 03:00 is two real hours away.
+        (datetime(2025, 3, 9, 5, 0, tzinfo=UTC), 2),
+        # Plain night for reference.
+        (datetime(2025, 6, 1, 4, 0, tzinfo=UTC), 3),
+    ],
+)
+def test_scheduled_worker_sleeps_real_time_across_dst(
+    monkeypatch, start: datetime, first_delay_hours: int
+) -> None:
+    tz = ZoneInfo("America/New_York")
+    assert start.astimezone(tz).hour == 0  # local midnight
+
+    delays, fired_at = _run_worker_over(monkeypatch, start, tz)
+
+    assert delays[0] == first_delay_hours * 3600
+    assert delays[1] == 24 * 3600
+    assert [(t.hour, t.minute) for t in fired_at] == [(3, 0), (3, 0)]
@@ -28,6 +28,19 @@ def test_build_message_timestamp_prefix_uses_configured_timezone() -> None:
     assert prefix == "[Friday, 2026-03-06T09:45:00-08:00]"
 
 
+def test_build_message_timestamp_prefix_string_is_keyed_by_timezone() -> None:
+    created_at = "2026-03-06T17:45:00Z"
+
+    assert (
+        build_message_timestamp_prefix(_config(), created_at=created_at)
+        == "[Friday, 2026-03-06T09:45:00-08:00]"
+    )
+    assert (
+        build_message_timestamp_prefix(_config("UTC"), created_at=created_at)
+        == "[Friday, 2026-03-06T17:45:00+00:00]"
+    )
+
+
 def test_render_message_timestamps_stamps_user_messages_only() -> None:
     messages = [
         {"role": "system", "content": "# System"},
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
 from operator_ai.config import Config
-from operator_ai.prompts import CACHE_BOUNDARY, assemble_system_prompt
+from operator_ai.prompts import CACHE_BOUNDARY, assemble_system_prompt, load_system_prompt
 from operator_ai.tools.subagent import _build_subagent_prompt
 
 
@@ -59,3 +62,29 @@ def test_subagent_prompt_uses_shared_prompt_contract(monkeypatch) -> None:
     assert stable.startswith("# System\n\n# Agent\n\noperator")
     assert "You are a focused sub-agent." in dynamic
     assert "Focus on the timezone-aware interpretation." in dynamic
+
+
+def test_load_system_prompt_rereads_only_when_file_changes(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "SYSTEM.md"
+    monkeypatch.setattr("operator_ai.prompts.SYSTEM_PROMPT_PATH", path)
+
+    assert load_system_prompt()  # seeded from the bundled default
+    path.write_text("# Custom\n")
+    assert load_system_prompt() == "# Custom"
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def _read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _read_text)
+    assert load_system_prompt() == "# Custom"
+    assert reads == []
+
+    path.write_text("# Edited prompt\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_system_prompt() == "# Edited prompt"
+    assert reads == [path]
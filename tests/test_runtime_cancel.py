@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
-from operator_ai.main import AgentCancelledError, ConversationRuntime
+from operator_ai.main import AgentCancelledError, ConversationRuntime, Dispatcher
 
 
 def test_cancel_cancels_attached_task() -> None:
@@ -45,3 +47,50 @@ def test_release_clears_stale_cancel_flag() -> None:
     runtime.cancel()
     runtime.release()
     runtime.check_cancelled()  # should not raise
+
+
+def test_run_claimed_tracks_task_and_rejects_while_busy() -> None:
+    dispatcher = Dispatcher.__new__(Dispatcher)
+    runtime = ConversationRuntime()
+    transport = SimpleNamespace(send=AsyncMock())
+    msg = SimpleNamespace(channel_id="C1", root_message_id="1.0")
+    seen: list[asyncio.Task | None] = []
+
+    async def _run_conversation(*_args) -> None:
+        seen.append(runtime._task)
+        await dispatcher._run_claimed(msg, transport, runtime, "conv", "agent")
+
+    dispatcher._run_conversation = _run_conversation  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        await dispatcher._run_claimed(msg, transport, runtime, "conv", "agent")
+
+    asyncio.run(_run())
+
+    assert seen and seen[0] is not None
+    transport.send.assert_awaited_once()
+    assert "Still processing" in transport.send.await_args.args[1]
+    assert not runtime.busy
+
+
+def test_dedup_skips_repeats_until_ttl_expires(monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("operator_ai.main.time", SimpleNamespace(monotonic=lambda: clock[0]))
+    dispatcher = Dispatcher.__new__(Dispatcher)
+    dispatcher._seen_messages = {}
+
+    def _msg(message_id: str, transport_name: str = "slack") -> SimpleNamespace:
+        return SimpleNamespace(message_id=message_id, transport_name=transport_name)
+
+    assert dispatcher._dedup(_msg("m1")) is False
+    assert dispatcher._dedup(_msg("m1")) is True
+    # Ids are tracked per transport.
+    assert dispatcher._dedup(_msg("m1", "other")) is False
+
+    clock[0] += Dispatcher._SEEN_TTL - 1
+    assert dispatcher._dedup(_msg("m1")) is True
+    assert dispatcher._dedup(_msg("m2")) is False
+
+    clock[0] += 2  # m1 is now past the TTL, m2 is not
+    assert dispatcher._dedup(_msg("m1")) is False
+    assert dispatcher._dedup(_msg("m2")) is True
@@ -8,6 +8,13 @@ import pytest
 import operator_ai.tools  # noqa: F401
 from operator_ai.tools import workspace
 from operator_ai.tools.files import _resolve, list_files, read_file, write_file
+from operator_ai.tools.registry import (
+    MAX_OUTPUT,
+    OUTPUT_BYTE_CAP,
+    format_process_output,
+)
+from operator_ai.tools.shell import run_shell
+from operator_ai.utils import read_capped
 
 # --- _resolve ---
 
@@ -18,6 +25,21 @@ def test_resolve_sandboxed_relative(tmp_path: Path):
     assert _resolve("foo.txt") == (tmp_path / "foo.txt").resolve()
 
 
+def test_resolve_follows_workspace_symlink_retarget(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "workspace"
+    link.symlink_to(first)
+    workspace.set_workspace(link, sandboxed=True)
+    assert _resolve("a.txt") == first.resolve() / "a.txt"
+
+    link.unlink()
+    link.symlink_to(second)
+    assert _resolve("a.txt") == second.resolve() / "a.txt"
+
+
 def test_resolve_sandboxed_rejects_escape(tmp_path: Path):
     workspace.set_workspace(tmp_path, sandboxed=True)
     with pytest.raises(ValueError, match="escapes workspace"):
@@ -70,6 +92,20 @@ def test_read_file_sandboxed_rejects_absolute(tmp_path: Path):
 # --- write_file ---
 
 
+def test_read_file_large_file_truncates_to_full_decode_prefix(tmp_path: Path):
+    workspace.set_workspace(tmp_path)
+    content = ("é" * 10 + "x\n") * 50_000
+    (tmp_path / "big.txt").write_text(content)
+    size = (tmp_path / "big.txt").stat().st_size
+
+    result = asyncio.run(read_file("big.txt"))
+
+    assert result == (
+        content[:MAX_OUTPUT] + f"\n[truncated — output exceeded 16KB, file is {size} bytes]"
+    )
+    assert asyncio.run(read_file("missing.txt")) == "[error: file not found: missing.txt]"
+
+
 def test_write_file_unsandboxed_absolute(tmp_path: Path):
     workspace.set_workspace(tmp_path, sandboxed=False)
     target = tmp_path.parent / "outside_write.txt"
@@ -109,3 +145,48 @@ def test_list_files_sandboxed_hides_outside_dirs(tmp_path: Path):
     (tmp_path / "inner" / "file.txt").write_text("hi")
     result = asyncio.run(list_files("."))
     assert "inner" in result
+
+
+# --- format_process_output ---
+
+
+def test_format_process_output_large_stdout_matches_full_decode():
+    stdout = ("é" * 10 + "x\n").encode() * 20_000 + b"\xff\xfe"
+    full = stdout.decode(errors="replace")
+
+    result = format_process_output(stdout, b"ignored", 1)
+
+    trailer = "\n[exit code: 1]"
+    assert result == (
+        full[: MAX_OUTPUT - len(trailer)] + "\n[truncated — output exceeded 16KB]" + trailer
+    )
+
+
+def test_format_process_output_small_streams_untouched():
+    assert format_process_output(b"out", b"err", 2) == "out\n[stderr]\nerr\n[exit code: 2]"
+
+
+def test_format_process_output_exit_code_only():
+    assert format_process_output(b"", b"", 3) == "[exit code: 3]"
+    assert format_process_output(b"", b"", 0) == "[no output]"
+
+
+def test_read_capped_drains_pipe_but_keeps_prefix():
+    async def _run() -> bytes:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"a" * 100_000)
+        reader.feed_data(b"b" * 100_000)
+        reader.feed_eof()
+        data = await read_capped(reader, OUTPUT_BYTE_CAP)
+        assert reader.at_eof()
+        return data
+
+    assert asyncio.run(_run()) == b"a" * OUTPUT_BYTE_CAP
+
+
+def test_run_shell_large_output_is_truncated(tmp_path: Path):
+    workspace.set_workspace(tmp_path)
+    result = asyncio.run(run_shell("head -c 500000 /dev/zero | tr '\\0' x; echo err >&2; exit 4"))
+    assert result.startswith("x" * 100)
+    assert "[truncated — output exceeded 16KB]" in result
+    assert result.endswith("[exit code: 4]")
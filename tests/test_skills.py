@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import stat
+from pathlib import Path
+
+from operator_ai.skills import (
+    _split_frontmatter,
+    extract_body,
+    parse_frontmatter,
+    rewrite_frontmatter,
+    scan_skills,
+)
+
+
+def test_scan_skills_reads_only_dirs_with_skill_md(tmp_path: Path) -> None:
+    skills_dir = tmp_path / "skills"
+    for name in ("beta", "alpha"):
+        (skills_dir / name).mkdir(parents=True)
+        (skills_dir / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {name} skill\n---\n\nBody.\n"
+        )
+    (skills_dir / "empty").mkdir()
+    (skills_dir / "notes.md").write_text("not a skill")
+
+    assert [s.name for s in scan_skills(skills_dir)] == ["alpha", "beta"]
+    assert scan_skills(tmp_path / "missing") == []
+
+
+def test_split_frontmatter_handles_crlf() -> None:
+    text = "---\r\nname: demo\r\n---\r\n\r\nBody line\r\n"
+    assert _split_frontmatter(text) == ("name: demo", "\nBody line")
+    assert parse_frontmatter(text) == {"name": "demo"}
+
+
+def test_split_frontmatter_requires_closing_fence() -> None:
+    text = "---\nname: demo\n\nBody without a closing fence\n"
+    assert _split_frontmatter(text) is None
+    assert parse_frontmatter(text) is None
+    assert extract_body(text) == text.strip()
+
+
+def test_split_frontmatter_empty_block() -> None:
+    assert _split_frontmatter("---\n---\nBody\n") == ("", "Body")
+    assert parse_frontmatter("---\n---\nBody\n") is None
+    assert extract_body("---\n---\nBody\n") == "Body"
+
+
+def test_split_frontmatter_drops_only_final_newline_of_body() -> None:
+    assert _split_frontmatter("---\na: 1\n---\nBody\n\n\n") == ("a: 1", "Body\n\n")
+    assert _split_frontmatter("---\na: 1\n---\n") == ("a: 1", "")
+
+
+def test_split_frontmatter_breaks_lines_like_splitlines() -> None:
+    for sep in ("\r", "\x0c", "\x85", "\u2028"):
+        text = f"---{sep}a: 1{sep}---{sep}Body{sep}more"
+        assert _split_frontmatter(text) == ("a: 1", "Body\nmore")
+
+
+def test_rewrite_frontmatter_skips_noop_and_replaces_atomically(tmp_path: Path) -> None:
+    job_md = tmp_path / "JOB.md"
+    original = "---\nname: nightly\nenabled:   true\n---\n\nRun it.\n"
+    job_md.write_text(original)
+
+    assert rewrite_frontmatter(job_md, {"enabled": True})
+    assert job_md.read_text() == original
+
+    assert rewrite_frontmatter(job_md, {"enabled": False})
+    assert job_md.read_text() == "---\nname: nightly\nenabled: false\n---\n\nRun it.\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["JOB.md"]
+
+
+def test_rewrite_frontmatter_keeps_mode_and_writes_through_symlink(tmp_path: Path) -> None:
+    real = tmp_path / "real" / "SKILL.md"
+    real.parent.mkdir()
+    real.write_text("---\nname: demo\nenabled: true\n---\n\nBody.\n")
+    real.chmod(0o640)
+    link = tmp_path / "SKILL.md"
+    link.symlink_to(real)
+
+    assert rewrite_frontmatter(link, {"enabled": False})
+
+    assert link.is_symlink()
+    assert "enabled: false" in real.read_text()
+    assert stat.S_IMODE(real.stat().st_mode) == 0o640
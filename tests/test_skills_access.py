@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from operator_ai.tools.context import set_skill_filter
+from operator_ai.tools.registry import MAX_OUTPUT
 from operator_ai.tools.skills_access import (
     _check_skill_access,
     read_skill,
@@ -114,6 +115,16 @@ def test_read_skill_reads_specific_path(tmp_path: Path) -> None:
         assert "API Reference" in result
 
 
+def test_read_skill_truncates_large_file(tmp_path: Path) -> None:
+    """Large files are read only up to the output cap and marked truncated."""
+    skill_dir = _make_skill(tmp_path, "my-skill")
+    (skill_dir / "big.md").write_text("é" * (MAX_OUTPUT * 3))
+    with patch("operator_ai.tools.skills_access.SKILLS_DIR", tmp_path):
+        set_skill_filter(None)
+        result = asyncio.run(read_skill("my-skill", "big.md"))
+        assert result == "é" * MAX_OUTPUT + "\n[truncated — output exceeded 16KB]"
+
+
 def test_read_skill_blocks_path_traversal(tmp_path: Path) -> None:
     """Path traversal with .. should be blocked."""
     _make_skill(tmp_path, "my-skill")
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from operator_ai.status import StatusIndicator
+from operator_ai.transport.base import Transport
+
+
+@pytest.fixture(autouse=True)
+def _fast_ticks(monkeypatch) -> None:
+    monkeypatch.setattr("operator_ai.status.TICK_INTERVAL", 0.01)
+    monkeypatch.setattr("operator_ai.status.REFRESH_INTERVAL", 3600)
+
+
+def _transport() -> AsyncMock:
+    transport = AsyncMock(spec=Transport)
+    transport.send.return_value = "M1"
+    return transport
+
+
+def test_status_edits_only_when_label_changes() -> None:
+    transport = _transport()
+
+    async def _run() -> None:
+        status = StatusIndicator(transport, "C1", "T1")
+        await status.start()
+        await asyncio.sleep(0.05)
+        assert transport.update.await_count == 0
+
+        status.set_tool("run_shell", {"command": "ls"})
+        await asyncio.sleep(0.05)
+        assert transport.update.await_count == 1
+        assert "Running command..." in transport.update.await_args.args[2]
+
+        await asyncio.sleep(0.05)
+        assert transport.update.await_count == 1
+        await status.stop()
+
+    asyncio.run(_run())
+
+    transport.delete.assert_awaited_once_with("C1", "M1", thread_id="T1")
+
+
+def test_status_refreshes_unchanged_label_after_interval(monkeypatch) -> None:
+    monkeypatch.setattr("operator_ai.status.REFRESH_INTERVAL", 0.03)
+    transport = _transport()
+
+    async def _run() -> None:
+        status = StatusIndicator(transport, "C1")
+        await status.start()
+        await asyncio.sleep(0.1)
+        await status.stop()
+
+    asyncio.run(_run())
+
+    assert transport.update.await_count >= 1
+
+
+def test_stop_waits_for_in_flight_edit_instead_of_cancelling() -> None:
+    transport = _transport()
+    events: list[str] = []
+
+    async def _run() -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _slow_update(*_args, **_kwargs) -> None:
+            started.set()
+            await release.wait()
+            events.append("update")
+
+        async def _delete(*_args, **_kwargs) -> None:
+            events.append("delete")
+
+        transport.update.side_effect = _slow_update
+        transport.delete.side_effect = _delete
+
+        status = StatusIndicator(transport, "C1")
+        await status.start()
+        status.set_tool("web_fetch", {"url": "https://example.com"})
+        await started.wait()
+
+        stopping = asyncio.create_task(status.stop())
+        await asyncio.sleep(0.05)
+        assert not stopping.done()
+
+        release.set()
+        await stopping
+
+    asyncio.run(_run())
+
+    assert events == ["update", "delete"]
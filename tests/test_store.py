@@ -281,6 +281,64 @@ def test_load_messages_trims_incomplete_tool_turns(store: Store) -> None:
     assert store.load_messages(conv) == loaded
 
 
+def _first_message_json(store: Store, conv: str) -> str:
+    return store._conn.execute(
+        "SELECT message_json FROM messages WHERE conversation_id = ? ORDER BY id LIMIT 1",
+        (conv,),
+    ).fetchone()[0]
+
+
+def test_ensure_system_message_updates_only_changed_prompt(store: Store) -> None:
+    conv = "conv-sys"
+    store.ensure_conversation(conv, "slack", "C1", "T1")
+    store.ensure_system_message(conv, "first")
+    store.ensure_system_message(conv, "first")
+    assert store.load_messages(conv) == [{"role": "system", "content": "first"}]
+
+    # Rows written with the older JSON spacing are normalized on first sight.
+    store._conn.execute(
+        "UPDATE messages SET message_json = ? WHERE conversation_id = ?",
+        ('{"role": "system", "content": "first"}', conv),
+    )
+    store.ensure_system_message(conv, "first")
+    assert _first_message_json(store, conv) == '{"role":"system","content":"first"}'
+
+    # ...and still compare by content when the prompt has changed.
+    store._conn.execute(
+        "UPDATE messages SET message_json = ? WHERE conversation_id = ?",
+        ('{"role": "system", "content": "first"}', conv),
+    )
+    store.ensure_system_message(conv, "second")
+    assert store.load_messages(conv) == [{"role": "system", "content": "second"}]
+    assert _first_message_json(store, conv) == '{"role":"system","content":"second"}'
+
+    # Extra keys on the stored message survive a prompt change.
+    store._conn.execute(
+        "UPDATE messages SET message_json = ? WHERE conversation_id = ?",
+        ('{"role":"system","content":"second","name":"sys"}', conv),
+    )
+    store.ensure_system_message(conv, "third")
+    assert store.load_messages(conv) == [{"role": "system", "content": "third", "name": "sys"}]
+
+
+def test_load_text_turns_returns_only_plain_user_and_assistant_text(store: Store) -> None:
+    conv = "conv-text"
+    store.ensure_conversation(conv, "slack", "C1", "T1")
+    store.ensure_system_message(conv, "system")
+    store.append_messages(
+        conv,
+        [
+            {"role": "user", "content": "hi"},
+            {"role": "user", "content": [{"type": "text", "text": "with image"}]},
+            {"role": "assistant", "content": None, "tool_calls": [{"id": "call_1"}]},
+            {"role": "tool", "tool_call_id": "call_1", "content": "big output"},
+            {"role": "assistant", "content": "done"},
+        ],
+    )
+
+    assert store.load_text_turns(conv) == [("user", "hi"), ("assistant", "done")]
+
+
 def test_load_messages_preserves_created_at_metadata(store: Store) -> None:
     conv = "conv-ts"
     store.ensure_conversation(conv, "slack", "C1", "T1")
@@ -366,3 +424,23 @@ def test_load_messages_keeps_complete_tool_turns(store: Store) -> None:
         {"role": "tool", "tool_call_id": "call_1", "content": "t1"},
         {"role": "assistant", "content": "done"},
     ]
+
+
+def test_append_messages_stores_compact_json(store: Store) -> None:
+    conv = "conv-compact"
+    store.ensure_conversation(conv, "slack", "C1", "T1")
+    store.append_messages(conv, [{"role": "user", "content": "hi"}])
+
+    row = store._conn.execute(
+        "SELECT message_json FROM messages WHERE conversation_id = ?", (conv,)
+    ).fetchone()
+
+    assert row["message_json"] == '{"role":"user","content":"hi"}'
+
+
+def test_index_platform_messages_maps_every_id(store: Store) -> None:
+    store.ensure_conversation("conv-idx", "slack", "C1", "T1")
+    store.index_platform_messages("slack", ["T1", "M2"], "conv-idx")
+
+    assert store.lookup_platform_message("slack", "T1") == "conv-idx"
+    assert store.lookup_platform_message("slack", "M2") == "conv-idx"
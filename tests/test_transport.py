@@ -3,9 +3,16 @@ from __future__ import annotations
 import asyncio
 from zoneinfo import ZoneInfo
 
+import pytest
+
 import operator_ai.tools  # noqa: F401  — warm up circular imports
-from operator_ai.transport.base import MessageContext
-from operator_ai.transport.slack import SlackTransport
+from operator_ai.transport.base import Attachment, MessageContext
+from operator_ai.transport.slack import (
+    SlackTransport,
+    _accepts_dm,
+    _accepts_mention,
+    _extract_attachments,
+)
 
 
 def test_to_prompt_with_username() -> None:
@@ -60,3 +67,133 @@ def test_slack_message_formatting_uses_configured_timezone() -> None:
     )
 
     assert "[Gavin] 9:00 PM: Hello" in formatted
+
+
+def test_slack_tools_built_once_per_transport() -> None:
+    transport = SlackTransport(
+        name="slack",
+        agent_name="operator",
+        bot_token="xoxb-test",
+        app_token="xapp-test",
+    )
+
+    first = transport.get_tools()
+    second = transport.get_tools()
+
+    assert [t.name for t in first] == ["list_channels", "read_channel", "read_thread"]
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert first[0].to_openai_tool() is second[0].to_openai_tool()
+
+
+class _FakeContent:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    async def iter_chunked(self, _size: int):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeResponse:
+    content_length = None
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.content = _FakeContent(chunks)
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def __aenter__(self) -> _FakeResponse:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+
+class _FakeSession:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    def get(self, _url: str) -> _FakeResponse:
+        return _FakeResponse(self._chunks)
+
+
+def test_slack_download_without_length_streams_into_one_buffer() -> None:
+    transport = SlackTransport(
+        name="slack",
+        agent_name="operator",
+        bot_token="xoxb-test",
+        app_token="xapp-test",
+    )
+    transport._get_http = lambda: _FakeSession([b"abc", b"", b"def"])  # type: ignore[method-assign]
+    att = Attachment("f.bin", "application/octet-stream", 6, "https://files.example/f.bin")
+
+    assert asyncio.run(transport.download_file(att)) == b"abcdef"
+
+    transport._MAX_DOWNLOAD = 4
+    with pytest.raises(ValueError, match="File too large"):
+        asyncio.run(transport.download_file(att))
+
+
+def test_slack_background_task_failure_is_logged_and_untracked(caplog) -> None:
+    transport = SlackTransport(
+        name="slack",
+        agent_name="operator",
+        bot_token="xoxb-test",
+        app_token="xapp-test",
+    )
+
+    async def _boom() -> None:
+        raise RuntimeError("handler exploded")
+
+    async def _run() -> None:
+        transport._create_task(_boom())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    with caplog.at_level("ERROR", logger="operator.transport.slack"):
+        asyncio.run(_run())
+
+    assert not transport._background_tasks
+    assert "Slack event handler failed" in caplog.text
+
+
+def test_slack_event_filters_keep_only_handled_messages() -> None:
+    assert _accepts_mention({"channel_type": "channel", "text": "hi"})
+    assert _accepts_mention({"channel_type": "channel", "subtype": "file_share"})
+    assert _accepts_mention({"channel_type": "channel", "subtype": ""})
+    assert not _accepts_mention({"channel_type": "im", "text": "hi"})
+    assert not _accepts_mention({"channel_type": "channel", "subtype": "message_changed"})
+
+    assert _accepts_dm({"channel_type": "im", "text": "hi"})
+    assert _accepts_dm({"channel_type": "im", "subtype": "file_share"})
+    assert _accepts_dm({"channel_type": "im", "subtype": ""})
+    assert not _accepts_dm({"channel_type": "im", "bot_id": "B1"})
+    assert not _accepts_dm({"channel_type": "im", "subtype": "channel_join"})
+    assert not _accepts_dm({"channel_type": "channel", "text": "hi"})
+
+
+def test_slack_attachments_use_original_file_url() -> None:
+    event = {
+        "files": [
+            {
+                "id": "F1",
+                "name": "photo.png",
+                "mimetype": "image/png",
+                "size": 10,
+                "url_private": "https://files.example/view/photo.png",
+                "url_private_download": "https://files.example/download/photo.png",
+                "thumb_360": "https://files.example/thumb/photo_360.png",
+            },
+            {"id": "F2", "name": "old.txt", "url_private": "https://files.example/old.txt"},
+            {"id": "F3", "name": "gone.txt"},
+        ]
+    }
+
+    attachments = _extract_attachments(event)
+
+    assert [a.url for a in attachments] == [
+        "https://files.example/download/photo.png",
+        "https://files.example/old.txt",
+    ]